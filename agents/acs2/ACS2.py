@@ -6,6 +6,7 @@
 
 from agents.common.BaseConfiguration import BaseConfiguration
 from agents.common.Agent import Agent, TrialMetrics
+from agents.common.Transition import Transition
 from agents.common.classifier_components import BaseClassifier
 from agents.common.mechanisms.action_selection import choose_classifier
 
@@ -57,7 +58,8 @@ class ACS2(Agent):
                     action_classifier.action,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state)
                 )
                 ACS2ClassifiersList.apply_reinforcement_learning(
                     action_set, 
@@ -72,7 +74,8 @@ class ACS2(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
             # Choose classifier
@@ -97,7 +100,8 @@ class ACS2(Agent):
                     action_classifier.action,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state)
                 )
                 ACS2ClassifiersList.apply_reinforcement_learning(
                     action_set, 
@@ -112,9 +116,12 @@ class ACS2(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
+            if self.scheduler is not None:
+                self.scheduler.end_step()
             steps += 1
         return TrialMetrics(steps, total_reward)
 
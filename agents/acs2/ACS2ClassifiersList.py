@@ -11,9 +11,11 @@ import agents.common.mechanisms.alp as alp_common
 import agents.common.mechanisms.genetic_algorithms as ga
 from agents.common.BaseConfiguration import BaseConfiguration
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.BaseClassifiersList import BaseClassifiersList
+from agents.common.LearningScheduler import LearningScheduler
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
-from agents.common.mechanisms.reinforcement_learning import update_classifier_q_learning
+from agents.common.mechanisms.reinforcement_learning import update_q_learning_batch
 
 
 class ACS2ClassifiersList(BaseClassifiersList):
@@ -34,7 +36,8 @@ class ACS2ClassifiersList(BaseClassifiersList):
             action: int,
             p1: Perception,
             time: int,
-            cfg: BaseConfiguration
+            cfg: BaseConfiguration,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles insertion, update and deletion
@@ -50,7 +53,11 @@ class ACS2ClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: BaseConfiguration
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, computed here if not given
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         new_list = ACS2ClassifiersList()
         new_cl: Optional[BaseClassifier] = None
         was_expected_case = False
@@ -65,11 +72,11 @@ class ACS2ClassifiersList(BaseClassifiersList):
             cl.increase_experience()
             cl.set_alp_timestamp(time)
 
-            if cl.does_anticipate_correctly(p0, p1):
-                new_cl = alp_common.expected_case(cl, p0, time)
+            if cl.does_anticipate_correctly(p0, p1, transition=transition):
+                new_cl = alp_common.expected_case(cl, p0, time, transition=transition)
                 was_expected_case = True
             else:
-                new_cl = alp_common.unexpected_case(cl, p0, p1, time)
+                new_cl = alp_common.unexpected_case(cl, p0, p1, time, transition)
 
             if cl.is_inadequate():
                 # Removes classifier from population, match set
@@ -110,8 +117,7 @@ class ACS2ClassifiersList(BaseClassifiersList):
             max_fitness: float
             cfg: BaseConfiguration
         """
-        for cl in action_set:
-            update_classifier_q_learning(cl, reward, max_fitness, cfg.beta_rl, cfg.gamma)
+        update_q_learning_batch(action_set, reward, max_fitness, cfg.beta_rl, cfg.gamma)
 
 
     @staticmethod
@@ -122,7 +128,8 @@ class ACS2ClassifiersList(BaseClassifiersList):
             p0: Perception,
             p1: Perception,
             time: int,
-            cfg: BaseConfiguration
+            cfg: BaseConfiguration,
+            scheduler: Optional[LearningScheduler] = None
         ) -> None:
         """
         The Genetic Generalization mechanism. Handles insertion, update and deletion
@@ -137,6 +144,8 @@ class ACS2ClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: BaseConfiguration
+            scheduler: Optional[LearningScheduler]
+                Scheduler deferring the generation of offspring, if any
         """
         ga.apply(
             ACS2ClassifiersList,
@@ -148,5 +157,6 @@ class ACS2ClassifiersList(BaseClassifiersList):
             p0,
             p1,
             time,
-            cfg
+            cfg,
+            scheduler
         )
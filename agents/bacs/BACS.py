@@ -5,6 +5,7 @@
 """
 
 from agents.common.Agent import Agent, TrialMetrics
+from agents.common.Transition import Transition
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
 from agents.common.mechanisms.action_selection import choose_classifier
 
@@ -64,7 +65,8 @@ class BACS(Agent):
                         action_set,
                         prev_state,
                         state,
-                        time + steps
+                        time + steps,
+                        Transition(prev_state, state)
                     )
                 else:
                     BACSClassifiersList.apply_alp(
@@ -76,7 +78,8 @@ class BACS(Agent):
                         t_1_activated_classifier.action,
                         state,
                         time + steps,
-                        self.cfg
+                        self.cfg,
+                        Transition(prev_state, state)
                     )
                 BACSClassifiersList.apply_reinforcement_learning(
                     action_set,
@@ -91,7 +94,8 @@ class BACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
             # Choose classifier
@@ -155,7 +159,8 @@ class BACS(Agent):
                         action_set,
                         prev_state,
                         state,
-                        time + steps
+                        time + steps,
+                        Transition(prev_state, state)
                     )
                 else:
                     BACSClassifiersList.apply_alp(
@@ -167,7 +172,8 @@ class BACS(Agent):
                         t_1_activated_classifier.action,
                         state,
                         time + steps,
-                        self.cfg
+                        self.cfg,
+                        Transition(prev_state, state)
                     )
                 BACSClassifiersList.apply_reinforcement_learning(
                     action_set,
@@ -182,9 +188,12 @@ class BACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
+            if self.scheduler is not None:
+                self.scheduler.end_step()
             steps += 1
         return TrialMetrics(steps, last_reward)
 
@@ -10,9 +10,11 @@ from typing import Optional
 import agents.common.mechanisms.alp as alp_common
 import agents.common.mechanisms.genetic_algorithms as ga
 from agents.common.BaseClassifiersList import BaseClassifiersList
+from agents.common.LearningScheduler import LearningScheduler
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
-from agents.common.mechanisms.reinforcement_learning import update_classifier_q_learning
+from agents.common.mechanisms.reinforcement_learning import update_q_learning_batch
 
 from agents.bacs.BACSConfiguration import BACSConfiguration
 import agents.bacs.mechanisms.alp as alp_bacs
@@ -37,7 +39,8 @@ class BACSClassifiersList(BaseClassifiersList):
             action: int,
             p1: Perception,
             time: int,
-            cfg: BACSConfiguration
+            cfg: BACSConfiguration,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles insertion, update and deletion
@@ -54,7 +57,11 @@ class BACSClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: BACSConfiguration
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, computed here if not given
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         new_list = BACSClassifiersList()
         new_cl: Optional[BaseClassifier] = None
         was_expected_case = False
@@ -68,11 +75,11 @@ class BACSClassifiersList(BaseClassifiersList):
             cl.increase_experience()
             cl.set_alp_timestamp(time)
 
-            if cl.does_anticipate_correctly(p0, p1):
-                new_cl = alp_bacs.expected_case(last_activated_classifier, cl, p0, p1, time)
+            if cl.does_anticipate_correctly(p0, p1, transition=transition):
+                new_cl = alp_bacs.expected_case(last_activated_classifier, cl, p0, p1, time, transition)
                 was_expected_case = True
             else:
-                new_cl = alp_common.unexpected_case(cl, p0, p1, time)
+                new_cl = alp_common.unexpected_case(cl, p0, p1, time, transition)
 
             if cl.is_inadequate():
                 # Removes classifier from population, match set
@@ -107,7 +114,8 @@ class BACSClassifiersList(BaseClassifiersList):
             action_set: BACSClassifiersList,
             p0: Perception,
             p1: Perception,
-            time: int
+            time: int,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles insertion, update and deletion
@@ -121,7 +129,11 @@ class BACSClassifiersList(BaseClassifiersList):
             p0: Perception
             p1: Perception
             time: int
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, computed here if not given
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         new_list = BACSClassifiersList()
         new_cl: Optional[BaseClassifier] = None
 
@@ -135,14 +147,14 @@ class BACSClassifiersList(BaseClassifiersList):
             cl.set_alp_timestamp(time)
 
             # Useless case
-            if (p0 == p1):
+            if not transition.changed_indices:
                 cl.decrease_quality()
             # Expected case
-            elif cl.does_anticipate_correctly(p0, p1):
-                new_cl = alp_common.expected_case(cl, p0, time, p1)
+            elif cl.does_anticipate_correctly(p0, p1, transition=transition):
+                new_cl = alp_common.expected_case(cl, p0, time, p1, transition)
             # Unexpected case
             else:
-                new_cl = alp_common.unexpected_case(cl, p0, p1, time)
+                new_cl = alp_common.unexpected_case(cl, p0, p1, time, transition)
 
             if new_cl is not None:
                 new_cl.tga = time
@@ -180,8 +192,7 @@ class BACSClassifiersList(BaseClassifiersList):
             max_fitness: float
             cfg: BaseConfiguration
         """
-        for cl in action_set:
-            update_classifier_q_learning(cl, reward, max_fitness, cfg.beta_rl, cfg.gamma)
+        update_q_learning_batch(action_set, reward, max_fitness, cfg.beta_rl, cfg.gamma)
 
 
     @staticmethod
@@ -192,7 +203,8 @@ class BACSClassifiersList(BaseClassifiersList):
             p0: Perception,
             p1: Perception,
             time: int,
-            cfg: BACSConfiguration
+            cfg: BACSConfiguration,
+            scheduler: Optional[LearningScheduler] = None
         ) -> None:
         """
         The Genetic Generalization mechanism. Handles insertion, update and deletion
@@ -207,6 +219,8 @@ class BACSClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: BACSConfiguration
+            scheduler: Optional[LearningScheduler]
+                Scheduler deferring the generation of offspring, if any
         """
         if action_set is None or not action_set:
             return False
@@ -224,5 +238,6 @@ class BACSClassifiersList(BaseClassifiersList):
             p0,
             p1,
             time,
-            cfg
+            cfg,
+            scheduler
         )
@@ -7,6 +7,7 @@
 from typing import Optional
 
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
 import agents.common.mechanisms.aliasing_detection as aliasing_detection
 import agents.common.mechanisms.alp as alp_common
@@ -19,7 +20,8 @@ def expected_case(
         cl: BaseClassifier,
         p0: Perception,
         p1: Perception,
-        time: int
+        time: int,
+        transition: Optional[Transition] = None
     ) -> Optional[BaseClassifier]:
     """
     Controls the expected case of a classifier with the help of 
@@ -35,6 +37,7 @@ def expected_case(
         p0: Perception
         p1: Perception
         time: int
+        transition: Optional[Transition]
 
     Returns
     ----------
@@ -47,4 +50,4 @@ def expected_case(
             if child:
                 return child
 
-    return alp_common.expected_case(cl, p0, time, p1)
\ No newline at end of file
+    return alp_common.expected_case(cl, p0, time, p1, transition)
\ No newline at end of file
@@ -28,15 +28,16 @@ def _updated_passthrough(
         last_effect: Effect
         child_condition: Condition
     """
-    for i in range(len(child_effect)):
-        if last_effect[i] == child_effect.wildcard:
-            child_effect[i] = penultimate_effect[i]
-        else:
-            child_effect[i] = last_effect[i]
-    # Refining effect
-    for idx, effect_item in enumerate(child_effect):
-        if effect_item != child_effect.wildcard and effect_item == child_condition[idx]:
-            child_effect[idx] = child_effect.wildcard
+    with child_effect.edit() as items:
+        for i in range(len(items)):
+            if last_effect[i] == child_effect.wildcard:
+                items[i] = penultimate_effect[i]
+            else:
+                items[i] = last_effect[i]
+        # Refining effect
+        for idx, effect_item in enumerate(items):
+            if effect_item != child_effect.wildcard and effect_item == child_condition[idx]:
+                items[idx] = child_effect.wildcard
 
 
 def create_behavioral_classifier(
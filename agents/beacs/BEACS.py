@@ -5,6 +5,7 @@
 """
 
 from agents.common.Agent import Agent, TrialMetrics
+from agents.common.Transition import Transition
 from agents.common.mechanisms.action_selection import choose_classifier
 
 from agents.beacs.BEACSClassifiersList import BEACSClassifiersList
@@ -80,7 +81,9 @@ class BEACS(Agent):
                     state,
                     time + steps,
                     self.pai_states_memory,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state),
+                    self.scheduler
                 )
                 BEACSClassifiersList.apply_reinforcement_learning(
                     action_set,
@@ -96,7 +99,8 @@ class BEACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
             # Record the previous match set
@@ -151,7 +155,9 @@ class BEACS(Agent):
                     state,
                     time + steps,
                     self.pai_states_memory,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state),
+                    self.scheduler
                 )
                 BEACSClassifiersList.apply_reinforcement_learning(
                     action_set,
@@ -167,9 +173,12 @@ class BEACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
+            if self.scheduler is not None:
+                self.scheduler.end_step()
             steps += 1
         return TrialMetrics(steps, total_reward)
 
@@ -10,12 +10,14 @@ from typing import Optional
 import agents.common.mechanisms.alp as alp_common
 import agents.common.mechanisms.genetic_algorithms as ga
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.BaseClassifiersList import BaseClassifiersList
+from agents.common.LearningScheduler import LearningScheduler
 
 import agents.beacs.mechanisms.alp as alp_beacs
 from agents.beacs.BEACSConfiguration import BEACSConfiguration
 from agents.beacs.classifier_components.BEACSClassifier import BEACSClassifier
-from agents.beacs.mechanisms.reinforcement_learning import update_classifier_double_q_learning
+from agents.beacs.mechanisms.reinforcement_learning import update_double_q_learning_batch
 from agents.beacs.mechanisms.genetic_algorithms import mutation_enhanced_trace
 
 
@@ -44,7 +46,7 @@ class BEACSClassifiersList(BaseClassifiersList):
         ----------
         BEACSClassifiersList
         """
-        matching = [cl for cl in self if cl.does_match(situation)]
+        matching = self.matching(situation)
         max_fitness_r = max((cl.q*cl.r for cl in matching), default=0.)
         max_fitness_r_bis = max((cl.q*cl.r_bis for cl in matching), default=0.)
         return BEACSClassifiersList(*matching), max_fitness_r, max_fitness_r_bis
@@ -63,7 +65,9 @@ class BEACSClassifiersList(BaseClassifiersList):
             p1: Perception,
             time: int,
             pai_states_memory: list(Perception),
-            cfg: BEACSConfiguration
+            cfg: BEACSConfiguration,
+            transition: Optional[Transition] = None,
+            scheduler: Optional[LearningScheduler] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles insertion, update and deletion
@@ -83,7 +87,13 @@ class BEACSClassifiersList(BaseClassifiersList):
             time: int
             pai_states_memory: list(Perception)
             cfg: BEACSConfiguration
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, computed here if not given
+            scheduler: Optional[LearningScheduler]
+                Scheduler deferring the PAI detection, if any
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         new_list = BEACSClassifiersList()
         new_cl: Optional[BEACSClassifier] = None
         was_expected_case = False
@@ -100,13 +110,13 @@ class BEACSClassifiersList(BaseClassifiersList):
             cl.set_alp_timestamp(time)
             is_aliasing_detected = False
 
-            if cl.does_anticipate_correctly(p0, p1):
-                is_aliasing_detected, new_cl = alp_beacs.expected_case(cl, p0, time)
+            if cl.does_anticipate_correctly(p0, p1, transition=transition):
+                is_aliasing_detected, new_cl = alp_beacs.expected_case(cl, p0, time, transition)
                 was_expected_case = True
                 if cfg.bs_max > 0 and penultimate_classifier is not None and is_aliasing_detected:
                     potential_cls_for_pai.append(cl)
             else:
-                new_cl = alp_common.unexpected_case(cl, p0, p1, time)
+                new_cl = alp_common.unexpected_case(cl, p0, p1, time, transition)
 
             if cl.is_inadequate():
                 # Removes classifier from population, match set
@@ -136,7 +146,7 @@ class BEACSClassifiersList(BaseClassifiersList):
             alp_beacs.apply_enhanced_effect_part_check(action_set, new_list, p0, time)
 
         if cfg.bs_max > 0 and penultimate_classifier is not None and len(potential_cls_for_pai) > 0:
-            alp_beacs.apply_perceptual_aliasing_issue_management(population, t_2_match_set, t_1_match_set, match_set, action_set, penultimate_classifier, potential_cls_for_pai, new_list, p0, p1, time, pai_states_memory, cfg)
+            alp_beacs.apply_perceptual_aliasing_issue_management(population, t_2_match_set, t_1_match_set, match_set, action_set, penultimate_classifier, potential_cls_for_pai, new_list, p0, p1, time, pai_states_memory, cfg, scheduler)
 
         # Merge classifiers from new_list into self and population
         BEACSClassifiersList.merge_newly_built_classifiers(new_list, population, match_set, action_set, p0, p1)
@@ -161,8 +171,7 @@ class BEACSClassifiersList(BaseClassifiersList):
             max_fitness_rb: float
             cfg: BEACSConfiguration
         """
-        for cl in action_set:
-            update_classifier_double_q_learning(cl, reward, max_fitness_ra, max_fitness_rb, cfg.beta_rl, cfg.gamma)
+        update_double_q_learning_batch(action_set, reward, max_fitness_ra, max_fitness_rb, cfg.beta_rl, cfg.gamma)
 
 
     @staticmethod
@@ -173,7 +182,8 @@ class BEACSClassifiersList(BaseClassifiersList):
             p0: Perception,
             p1: Perception,
             time: int,
-            cfg: BEACSConfiguration
+            cfg: BEACSConfiguration,
+            scheduler: Optional[LearningScheduler] = None
         ) -> None:
         """
         The Genetic Generalization mechanism. Handles insertion, update and deletion
@@ -188,6 +198,8 @@ class BEACSClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: BEACSConfiguration
+            scheduler: Optional[LearningScheduler]
+                Scheduler deferring the generation of offspring, if any
         """
         ga.apply(
             BEACSClassifiersList,
@@ -199,5 +211,6 @@ class BEACSClassifiersList(BaseClassifiersList):
             p0,
             p1,
             time,
-            cfg
+            cfg,
+            scheduler
         )
@@ -8,6 +8,7 @@ from typing import Callable
 
 from agents.common.EnvironmentAdapter import EnvironmentAdapter
 from agents.common.BaseConfiguration import BaseConfiguration
+from agents.common.SymbolAlphabet import SymbolAlphabet
 
 
 class BEACSConfiguration(BaseConfiguration):
@@ -35,6 +36,16 @@ class BEACSConfiguration(BaseConfiguration):
             theta_bseq: int=1000,
             bs_max: int=0,
             do_ep: bool = True,
+            match_engine: str = None,
+            match_set_cache_size: int = 0,
+            subsumption_index: bool = False,
+            symbol_alphabet: SymbolAlphabet = None,
+            sparse_effects: bool = False,
+            interning: bool = False,
+            ga_selection: str = None,
+            rng_block_size: int = 0,
+            learning_time_budget: float = 0.,
+            learning_operation_budget: int = 0,
         ) -> None:
         """
         Creates the configuration object used during training the beacs agent.
@@ -58,7 +69,17 @@ class BEACSConfiguration(BaseConfiguration):
             theta_ga=theta_ga,
             theta_as=theta_as,
             mu=mu,
-            chi=chi
+            chi=chi,
+            match_engine=match_engine,
+            match_set_cache_size=match_set_cache_size,
+            subsumption_index=subsumption_index,
+            symbol_alphabet=symbol_alphabet,
+            sparse_effects=sparse_effects,
+            interning=interning,
+            ga_selection=ga_selection,
+            rng_block_size=rng_block_size,
+            learning_time_budget=learning_time_budget,
+            learning_operation_budget=learning_operation_budget
         )
         self.theta_bseq = theta_bseq
         self.bs_max = bs_max
@@ -7,9 +7,12 @@
 from __future__ import annotations
 from typing import Optional, Union, List
 
-from agents.common import Perception
+from agents.common import Perception, Transition
+from agents.common.SymbolAlphabet import render_symbol
 from agents.common.classifier_components.Condition import Condition
 from agents.common.classifier_components.Effect import Effect
+from agents.common.classifier_components.SparseEffect import SparseEffect
+from agents.common.classifier_components.PMark import PMark
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
 
 from agents.beacs.BEACSConfiguration import BEACSConfiguration
@@ -21,6 +24,8 @@ class BEACSClassifier(BaseClassifier):
     Represents a BEACS classifier
     """
 
+    __slots__ = ['r_bis', 'tbseq', 'aliased_state', 'pai_state', 'err', '_fitness', '_fitness_key']
+
     def __init__(
             self,
             condition: Union[Condition, str, None] = None,
@@ -65,7 +70,8 @@ class BEACSClassifier(BaseClassifier):
             if initial:
                 return cls(initial, wildcard=wildcard)
             return cls.empty(wildcard=wildcard, length=length)
-        self.effect = EffectList(_build_perception_string(Effect, effect), self.cfg.classifier_length, self.cfg.classifier_wildcard)
+        effect_class = SparseEffect if self.cfg.sparse_effects else Effect
+        self.effect = EffectList(_build_perception_string(effect_class, effect), self.cfg.classifier_length, self.cfg.classifier_wildcard)
         self.r_bis = reward_bis
         self.tbseq = tbseq
         if aliased_state:
@@ -77,13 +83,14 @@ class BEACSClassifier(BaseClassifier):
         else:
             self.pai_state = Perception.empty()
         self.err = 0.
+        self._fitness_key = None
 
 
-    def __repr__(self) -> str:
+    def _render(self) -> str:
         return f"C:{self.condition} A:{self.action} {str(self.behavioral_sequence)} E:{str(self.effect)}\n" \
             f"q: {self.q:<6.4} r: {self.r:<6.4} r_bis: {self.r_bis:<6.4} ir: {self.ir:<6.4} f: {self.fitness:<6.4} err: {self.err:<6.4}\n" \
             f"exp: {self.exp:<5} num: {self.num} ee: {self.ee}\n" \
-            f"Mark: {str(self.mark)} Can_be_generalized: {str(self.effect.enhanced_trace_ga)} Aliased_state: {'.'.join(str(attr) for attr in self.aliased_state)} PAI_state: {'.'.join(str(attr) for attr in self.pai_state)}\n" \
+            f"Mark: {str(self.mark)} Can_be_generalized: {str(self.effect.enhanced_trace_ga)} Aliased_state: {'.'.join(render_symbol(attr) for attr in self.aliased_state)} PAI_state: {'.'.join(render_symbol(attr) for attr in self.pai_state)}\n" \
             f"tga: {self.tga:<5} tbseq: {self.tbseq:<5} talp: {self.talp:<5} tav: {self.tav:<6.4} \n" \
 
 
@@ -106,31 +113,33 @@ class BEACSClassifier(BaseClassifier):
         BEACSClassifier
             New copied classifier - Hard copy
         """
-        new_cls = BEACSClassifier(
-            condition=Condition(self.condition, self.cfg.classifier_wildcard),
-            action=self.action,
-            behavioral_sequence=self.behavioral_sequence,
-            quality=self.q,
-            reward=self.r,
-            reward_bis=self.r_bis,
-            immediate_reward=self.ir,
-            cfg=self.cfg,
-            tga=time,
-            tbseq=time,
-            talp=time,
-            tav=self.tav,
-            aliased_state=self.aliased_state,
-            pai_state=self.pai_state
-        )
-        new_cls.effect.effect_list = []
-        for oeffect in self.effect:
-            effect_to_append = Effect.empty(new_cls.cfg.classifier_length)
-            for i in range(new_cls.cfg.classifier_length):
-                effect_to_append[i] = oeffect[i]
-            new_cls.effect.effect_list.append(effect_to_append)
-        new_cls.effect.effect_detailled_counter = self.effect.effect_detailled_counter[:]
-        new_cls.effect.enhanced_trace_ga = self.effect.enhanced_trace_ga[:]
-        new_cls.effect.update_enhanced_trace_ga(new_cls.cfg.classifier_length)
+        # Attributes are set directly instead of going through __init__,
+        # conditions and effects share their immutable items with the copied ones
+        cfg = self.cfg
+        new_cls = BEACSClassifier.__new__(BEACSClassifier)
+        new_cls.cfg = cfg
+        new_cls.condition = self.condition.clone()
+        new_cls.action = self.action
+        new_cls.behavioral_sequence = self.behavioral_sequence
+        new_cls.mark = PMark(cfg=cfg)
+        new_cls.q = self.q
+        new_cls.r = self.r
+        new_cls.r_bis = self.r_bis
+        new_cls.ir = self.ir
+        new_cls.num = 1
+        new_cls.exp = 1
+        new_cls.talp = time
+        new_cls.tga = time
+        new_cls.tbseq = time
+        new_cls.tav = self.tav
+        new_cls.ee = False
+        new_cls.err = 0.
+        new_cls._fitness_key = None
+        new_cls.effect = self.effect.clone()
+        new_cls.effect.update_enhanced_trace_ga(cfg.classifier_length)
+        # Perceptions are immutable and can be shared
+        new_cls.aliased_state = self.aliased_state if self.aliased_state else Perception.empty()
+        new_cls.pai_state = self.pai_state if self.pai_state else Perception.empty()
         return new_cls
 
 
@@ -152,6 +161,24 @@ class BEACSClassifier(BaseClassifier):
 
     @property
     def fitness(self) -> float:
+        """
+        Returns the fitness of the classifier, computed again
+        only when quality, rewards or behavioral sequence length changed.
+
+        Returns
+        -------
+        float
+            Fitness value
+        """
+        # The sequence is extended in place, so its length is the key
+        key = (self.q, self.r, self.r_bis, len(self.behavioral_sequence) if self.behavioral_sequence else 0)
+        if key != self._fitness_key:
+            self._fitness = self._compute_fitness()
+            self._fitness_key = key
+        return self._fitness
+
+
+    def _compute_fitness(self) -> float:
         """
         Computes the fitness of the classifier.
 
@@ -188,7 +215,8 @@ class BEACSClassifier(BaseClassifier):
             self,
             previous_situation: Perception,
             situation: Perception,
-            update_counter: bool = True
+            update_counter: bool = True,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Checks anticipation. While the pass-through symbols in the effect part
@@ -205,12 +233,14 @@ class BEACSClassifier(BaseClassifier):
             previous_situation: Perception
             situation: Perception
             update_counter: bool = True
+            transition: Optional[Transition]
+                Transition between both situations, if already computed
 
         Returns
         -------
         bool
         """
-        return self.effect.does_anticipate_correctly(previous_situation, situation, update_counter)
+        return self.effect.does_anticipate_correctly(previous_situation, situation, update_counter, transition)
 
 
     def specialize(
@@ -231,24 +261,27 @@ class BEACSClassifier(BaseClassifier):
         length = self.cfg.classifier_length
         wildcard = self.cfg.classifier_wildcard
         if not self.is_enhanced():
-            for idx in range(length):
-                if previous_situation[idx] != situation[idx] and self.effect[0][idx] == wildcard:
-                    self.effect[0][idx] = situation[idx]
-                    self.condition[idx] = previous_situation[idx]
+            with self.condition.edit() as condition, self.effect[0].edit() as effect:
+                for idx in range(length):
+                    if previous_situation[idx] != situation[idx] and effect[idx] == wildcard:
+                        effect[idx] = situation[idx]
+                        condition[idx] = previous_situation[idx]
         else:
             if self.aliased_state != previous_situation:
-                for idx in range(length):
-                    if self.aliased_state[idx] != previous_situation[idx]:
-                        self.condition[idx] = self.aliased_state[idx]
-                        self.effect.enhanced_trace_ga[idx] = False
+                with self.condition.edit() as condition:
+                    for idx in range(length):
+                        if self.aliased_state[idx] != previous_situation[idx]:
+                            condition[idx] = self.aliased_state[idx]
+                            self.effect.enhanced_trace_ga[idx] = False
             else:
-                new_effect_index = len(self.effect)
-                self.effect.effect_list.append(Effect.empty(length, wildcard))
+                new_effect = type(self.effect[0]).empty(length, wildcard)
+                self.effect.effect_list.append(new_effect)
                 self.effect.effect_detailled_counter.append(1)
-                for idx in range(length):
-                    if previous_situation[idx] != situation[idx]:
-                        self.effect[new_effect_index][idx] = situation[idx]
-                        self.condition[idx] = previous_situation[idx]
+                with self.condition.edit() as condition, new_effect.edit() as effect:
+                    for idx in range(length):
+                        if previous_situation[idx] != situation[idx]:
+                            effect[idx] = situation[idx]
+                            condition[idx] = previous_situation[idx]
                 self.effect.update_enhanced_trace_ga(length)
 
 
@@ -0,0 +1,99 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+
+class BooleanTrace:
+    """
+    Fixed-length sequence of booleans packed in the bits of an integer,
+    the bit i holding the value of the item i.
+    It is printed as the list of booleans it replaces.
+    """
+
+    __slots__ = ['_bits', '_length']
+
+    def __init__(
+            self,
+            values: Iterable[bool] = ()
+        ) -> None:
+        bits = 0
+        length = 0
+        for value in values:
+            if value:
+                bits |= 1 << length
+            length += 1
+        self._bits = bits
+        self._length = length
+
+
+    @classmethod
+    def full(
+            cls,
+            length: int
+        ) -> BooleanTrace:
+        """
+        Creates a trace of `length` items set to True.
+
+        Parameters
+        ----------
+            length: int
+
+        Returns
+        -------
+        BooleanTrace
+        """
+        trace = cls.__new__(cls)
+        trace._bits = (1 << length) - 1
+        trace._length = length
+        return trace
+
+
+    def copy(self) -> BooleanTrace:
+        trace = BooleanTrace.__new__(BooleanTrace)
+        trace._bits = self._bits
+        trace._length = self._length
+        return trace
+
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("BooleanTrace index out of range")
+        return index
+
+
+    def __getitem__(self, index: int) -> bool:
+        return (self._bits >> self._index(index)) & 1 == 1
+
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        bit = 1 << self._index(index)
+        if value:
+            self._bits |= bit
+        else:
+            self._bits &= ~bit
+
+
+    def __len__(self) -> int:
+        return self._length
+
+
+    def __iter__(self) -> Iterator[bool]:
+        bits = self._bits
+        return ((bits >> idx) & 1 == 1 for idx in range(self._length))
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BooleanTrace):
+            return self._bits == other._bits and self._length == other._length
+        return list(self) == other
+
+
+    def __repr__(self) -> str:
+        return repr(list(self))
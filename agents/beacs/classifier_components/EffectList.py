@@ -8,15 +8,23 @@ from __future__ import annotations
 from typing import Optional
 
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.classifier_components.Effect import Effect
 
+from agents.beacs.classifier_components.BooleanTrace import BooleanTrace
+
 
 class EffectList():
     """
     List of anticipations with counters 
     that depicts the number of occurence of each anticipations.
+    The trace of the attributes that can be generalized is packed in the bits of an integer.
+    The frozenset of the anticipations used to compare effect lists is cached along
+    with the anticipations it was built from, which effects replace when modified.
     """
 
+    __slots__ = ['effect_list', 'effect_detailled_counter', 'enhanced_trace_ga', 'wildcard', '_signature', '_signature_anticipations']
+
     def __init__(
             self,
             effect: Optional[Effect] = None,
@@ -29,12 +37,63 @@ class EffectList():
         else:
             self.effect_list = []
             self.effect_detailled_counter = []
-        self.enhanced_trace_ga = [True] * length
+        self.enhanced_trace_ga = BooleanTrace.full(length)
         self.wildcard = wildcard
+        self._signature = None
+        self._signature_anticipations = None
+
+
+    def clone(self) -> EffectList:
+        """
+        Returns a copy of the effect list, whose effects share
+        their immutable items with the copied ones.
+
+        Returns
+        -------
+        EffectList
+        """
+        cloned = EffectList.__new__(EffectList)
+        cloned.effect_list = [effect.clone() for effect in self.effect_list]
+        cloned.effect_detailled_counter = self.effect_detailled_counter[:]
+        cloned.enhanced_trace_ga = self.enhanced_trace_ga.copy()
+        cloned.wildcard = self.wildcard
+        cloned._signature = self._signature
+        cloned._signature_anticipations = self._signature_anticipations
+        return cloned
+
+
+    @property
+    def signature(self) -> frozenset:
+        """
+        Returns the set of the anticipations of the effects, rebuilt only
+        when an effect was added or modified since it was last built.
+
+        Returns
+        -------
+        frozenset
+        """
+        effects = self.effect_list
+        anticipations = self._signature_anticipations
+        if anticipations is not None and len(anticipations) == len(effects):
+            for effect, anticipation in zip(effects, anticipations):
+                if effect._anticipation is not anticipation:
+                    break
+            else:
+                return self._signature
+        anticipations = tuple(effect.anticipation for effect in effects)
+        signature = frozenset(anticipations)
+        # Computed once, so that comparisons of unequal sets stop at their hashes
+        hash(signature)
+        self._signature = signature
+        self._signature_anticipations = anticipations
+        return signature
 
 
     def __eq__(self, other) -> bool:
-        return set(other.effect_list) == set(self.effect_list)
+        effects, other_effects = self.effect_list, other.effect_list
+        if len(effects) == 1 and len(other_effects) == 1:
+            return effects[0] == other_effects[0]
+        return self.signature == other.signature
 
 
     def __ne__(self, other) -> bool:
@@ -68,14 +127,12 @@ class EffectList():
         """
         for oi, oeffect in enumerate(other):
             if oeffect not in self:
-                effect_to_append = Effect.empty(length)
-                for i in range(length):
-                    effect_to_append[i] = oeffect[i]
-                self.effect_list.append(effect_to_append)
+                self.effect_list.append(oeffect.clone())
                 self.effect_detailled_counter.append(other.effect_detailled_counter[oi])
             else:
                 ei = self.effect_list.index(oeffect)
                 self.effect_detailled_counter[ei] += other.effect_detailled_counter[oi]
+        self._signature_anticipations = None
         self.update_enhanced_trace_ga(length)
 
 
@@ -91,12 +148,13 @@ class EffectList():
         ----------
             length: int
         """
-        for idx in range(length):
+        def can_be_generalized(idx):
             symbols = []
             for effect in self:
                 if effect[idx] not in symbols:
                     symbols.append(effect[idx])
-            self.enhanced_trace_ga[idx] = (self.wildcard not in symbols) or (len(symbols)==1)
+            return (self.wildcard not in symbols) or (len(symbols)==1)
+        self.enhanced_trace_ga = BooleanTrace(can_be_generalized(idx) for idx in range(length))
 
 
     @property
@@ -127,7 +185,8 @@ class EffectList():
     def is_specializable(
             self,
             p0: Perception,
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if the effect part can be modified to
@@ -139,19 +198,22 @@ class EffectList():
         ----------
             p0: Perception
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
 
         Returns
         -------
         bool
         """
-        return self.is_enhanced() or self[0].is_specializable(p0, p1)
+        return self.is_enhanced() or self[0].is_specializable(p0, p1, transition)
 
 
     def does_anticipate_correctly(
             self,
             p0: Perception,
             p1: Perception,
-            update_counters: bool = True
+            update_counters: bool = True,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if the effect list anticipates correctly changes from `p0` to `p1`.
@@ -161,13 +223,17 @@ class EffectList():
             p0: Perception
             p1: Perception
             update_counters: bool = True
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
 
         Returns
         -------
         bool
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         for idx, effect in enumerate(self):
-            if effect.does_anticipate_correctly(p0, p1):
+            if effect.does_anticipate_correctly(p0, p1, transition):
                 if self.is_enhanced() and update_counters:
                     self.effect_detailled_counter[idx] += 1
                 return True
@@ -189,7 +255,19 @@ class EffectList():
         -------
         bool
         """
-        return set(other.effect_list) <= set(self.effect_list)
+        return other.signature <= self.signature
+
+
+    def signatures(self) -> tuple:
+        """
+        Returns the hashable keys under which the effect list is indexed to look for subsumers.
+        An effect list subsuming another one contains its first effect.
+
+        Returns
+        -------
+        tuple
+        """
+        return tuple(effect.anticipation for effect in self.effect_list)
 
 
     def getEffectAttribute(
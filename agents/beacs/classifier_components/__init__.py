@@ -4,5 +4,6 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from .BooleanTrace import BooleanTrace
 from .EffectList import EffectList
 from .BEACSClassifier import BEACSClassifier
\ No newline at end of file
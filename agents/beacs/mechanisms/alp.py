@@ -5,13 +5,15 @@
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from agents.beacs.BEACSClassifiersList import BEACSClassifiersList
 
 import agents.common.mechanisms.aliasing_detection as aliasing_detection
 import agents.common.mechanisms.alp as alp_common
+from agents.common.LearningScheduler import LearningScheduler
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 
 import agents.beacs.mechanisms.pai_detection as pai_detection
 from agents.beacs.BEACSConfiguration import BEACSConfiguration
@@ -22,7 +24,8 @@ from agents.beacs.mechanisms.build_behavioral_sequences import create_behavioral
 def expected_case(
         cl: BEACSClassifier,
         p0: Perception,
-        time: int
+        time: int,
+        transition: Optional[Transition] = None
     ) -> (tuple[bool, None] | tuple[bool, BEACSClassifier]):
     """
     Controls the expected case of a classifier with the help of 
@@ -33,6 +36,7 @@ def expected_case(
         cl: BEACSClassifier
         p0: Perception
         time: int
+        transition: Optional[Transition]
 
     Returns
     ----------
@@ -51,7 +55,7 @@ def expected_case(
     if cl.is_enhanced():
         diff = cl.mark.get_differences(cl.aliased_state)
     else:
-        diff = cl.mark.get_differences(p0)
+        diff = cl.mark.get_differences(p0, transition)
     if diff.specificity == 0:
         cl.increase_quality()
         return is_aliasing_detected, None
@@ -103,10 +107,13 @@ def apply_perceptual_aliasing_issue_management(
         p1: Perception,
         time: int,
         pai_states_memory: list(Perception),
-        cfg: BEACSConfiguration
+        cfg: BEACSConfiguration,
+        scheduler: Optional[LearningScheduler] = None
     ) -> None:
     """
-    Used to manage the detection of PAI and the behavioral classifiers
+    Used to manage the detection of PAI and the behavioral classifiers.
+    With a learning scheduler, the detection is deferred, and behavioral
+    classifiers are created according to the PAI states known so far.
 
     Parameters
     ----------
@@ -123,6 +130,8 @@ def apply_perceptual_aliasing_issue_management(
         time: int
         pai_states_memory: list(Perception)
         cfg: BEACSConfiguration
+        scheduler: Optional[LearningScheduler]
+            Scheduler deferring the detection, if any
     """
     # First, try to detect if it is time to detect a pai state - no need to compute this every time
     knowledge_from_match_set = [cl for cl in t_1_match_set if
@@ -133,27 +142,69 @@ def apply_perceptual_aliasing_issue_management(
     if pai_detection.should_pai_detection_apply(knowledge_from_match_set, time, cfg.theta_bseq):
         # We set the related timestamp t_bseq of the classifiers in the match set
         pai_detection.set_pai_detection_timestamps(knowledge_from_match_set, time)
-        # We check we have enough information from classifiers in the matching set to do the detection
-        enough_information, most_experienced_classifiers = pai_detection.enough_information_to_try_PAI_detection(knowledge_from_match_set, cfg)
-        if enough_information:
-        # The system tries to determine is it suffers from the perceptual aliasing issue
-            if pai_detection.is_perceptual_aliasing_state(most_experienced_classifiers, p0, cfg) > 0:
-                # Add if needed the new pai state in memory
-                if p0 not in pai_states_memory:
-                    pai_states_memory.append(p0)
-            else:
-                # Remove if needed the pai state from memory and delete all behavioral classifiers created for this state
-                if p0 in pai_states_memory:
-                    pai_states_memory.remove(p0)
-                    behavioral_classifiers_to_delete = [cl for cl in population if cl.pai_state == p0]
-                    for cl in behavioral_classifiers_to_delete:
-                        lists = [x for x in [population, match_set, action_set] if x]
-                        for lst in lists:
-                            lst.safe_remove(cl)
+        if scheduler is not None:
+            scheduler.defer('pai_detection', _deferred_perceptual_aliasing_detection, population, knowledge_from_match_set, p0, pai_states_memory, cfg)
+        else:
+            detect_perceptual_aliasing(population, match_set, action_set, knowledge_from_match_set, p0, pai_states_memory, cfg)
 
     # Create new behavioral classifiers
     if p0 in pai_states_memory and len(potential_cls_for_pai) > 0:
         for candidate in potential_cls_for_pai:
             new_cl = create_behavioral_classifier(penultimate_classifier, candidate, p1, p0, time)
             if new_cl:
-                alp_common.add_classifier(new_cl, t_2_match_set, new_list)
\ No newline at end of file
+                alp_common.add_classifier(new_cl, t_2_match_set, new_list)
+
+
+def detect_perceptual_aliasing(
+        population: BEACSClassifiersList,
+        match_set: BEACSClassifiersList,
+        action_set: BEACSClassifiersList,
+        knowledge_from_match_set: list(BEACSClassifier),
+        p0: Perception,
+        pai_states_memory: list(Perception),
+        cfg: BEACSConfiguration
+    ) -> None:
+    """
+    Determines from the classifiers of the match set whether `p0` is a PAI state,
+    and updates accordingly the memory of the PAI states, deleting the behavioral
+    classifiers created for a state no longer considered as one.
+
+    Parameters
+    ----------
+        population: BEACSClassifiersList
+        match_set: BEACSClassifiersList
+        action_set: BEACSClassifiersList
+        knowledge_from_match_set: list(BEACSClassifier)
+        p0: Perception
+        pai_states_memory: list(Perception)
+        cfg: BEACSConfiguration
+    """
+    # We check we have enough information from classifiers in the matching set to do the detection
+    enough_information, most_experienced_classifiers = pai_detection.enough_information_to_try_PAI_detection(knowledge_from_match_set, cfg)
+    if enough_information:
+    # The system tries to determine is it suffers from the perceptual aliasing issue
+        if pai_detection.is_perceptual_aliasing_state(most_experienced_classifiers, p0, cfg) > 0:
+            # Add if needed the new pai state in memory
+            if p0 not in pai_states_memory:
+                pai_states_memory.append(p0)
+        else:
+            # Remove if needed the pai state from memory and delete all behavioral classifiers created for this state
+            if p0 in pai_states_memory:
+                pai_states_memory.remove(p0)
+                behavioral_classifiers_to_delete = [cl for cl in population if cl.pai_state == p0]
+                for cl in behavioral_classifiers_to_delete:
+                    lists = [x for x in [population, match_set, action_set] if x]
+                    for lst in lists:
+                        lst.safe_remove(cl)
+
+
+def _deferred_perceptual_aliasing_detection(
+        population: BEACSClassifiersList,
+        knowledge_from_match_set: list(BEACSClassifier),
+        p0: Perception,
+        pai_states_memory: list(Perception),
+        cfg: BEACSConfiguration
+    ) -> None:
+    # Classifiers deleted since the match set was formed are not considered
+    knowledge_from_match_set = [cl for cl in knowledge_from_match_set if cl in population]
+    detect_perceptual_aliasing(population, None, None, knowledge_from_match_set, p0, pai_states_memory, cfg)
@@ -33,28 +33,29 @@ def updated_passthrough(
         perception: Perception
         child_condition: Condition
     """
-    for i in range(len(child_effect)):
-        change_anticipated = last_effect[0][i] != child_effect.wildcard
-        if last_effect.is_enhanced():
-            for effect in last_effect:
-                if effect[i] != effect.wildcard and effect[i] == perception[i]:
-                    change_anticipated = True
-                    break
-        if change_anticipated :
-            child_effect[i] = perception[i]
-        else :
-            change_anticipated = penultimate_effect[0][i] != child_effect.wildcard
-            if penultimate_effect.is_enhanced():
-                for effect in penultimate_effect:
+    with child_effect.edit() as items:
+        for i in range(len(child_effect)):
+            change_anticipated = last_effect[0][i] != child_effect.wildcard
+            if last_effect.is_enhanced():
+                for effect in last_effect:
                     if effect[i] != effect.wildcard and effect[i] == perception[i]:
                         change_anticipated = True
                         break
             if change_anticipated :
-                child_effect[i] = perception[i]
-    # Refining effect
-    for idx in range(len(child_effect)):
-        if child_effect[idx] != child_effect.wildcard and child_effect[idx] == child_condition[idx]:
-            child_effect[idx] = child_effect.wildcard
+                items[i] = perception[i]
+            else :
+                change_anticipated = penultimate_effect[0][i] != child_effect.wildcard
+                if penultimate_effect.is_enhanced():
+                    for effect in penultimate_effect:
+                        if effect[i] != effect.wildcard and effect[i] == perception[i]:
+                            change_anticipated = True
+                            break
+                if change_anticipated :
+                    items[i] = perception[i]
+        # Refining effect
+        for idx in range(len(child_effect)):
+            if items[idx] != child_effect.wildcard and items[idx] == child_condition[idx]:
+                items[idx] = child_effect.wildcard
 
 
 def create_behavioral_classifier(
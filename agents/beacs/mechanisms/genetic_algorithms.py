@@ -23,29 +23,30 @@ def mutation_enhanced_trace(
         cl2: BEACSClassifier
         mu: float
     """
-    for idx in range(len(cl1.condition)):
-        #
-        if cl1.condition[idx] == cl1.cfg.classifier_wildcard and \
-            cl2.condition[idx] == cl2.cfg.classifier_wildcard:
-            continue
-        #
-        if cl1.condition[idx] != cl1.cfg.classifier_wildcard and \
-            cl2.condition[idx] == cl2.cfg.classifier_wildcard:
-            if RandomNumberGenerator.random() < mu and cl1.effect.enhanced_trace_ga[idx]:
-                cl1.condition.generalize(idx)
-            continue
-        #
-        if cl1.condition[idx] == cl1.cfg.classifier_wildcard and \
-            cl2.condition[idx] != cl2.cfg.classifier_wildcard:
-            if RandomNumberGenerator.random() < mu and cl2.effect.enhanced_trace_ga[idx]:
-                cl2.condition.generalize(idx)
-            continue
-        #
-        if cl1.condition[idx] != cl1.cfg.classifier_wildcard and \
-            cl1.behavioral_sequence is None and cl1.effect.enhanced_trace_ga[idx] and \
-                RandomNumberGenerator.random() < mu:
-            cl1.condition.generalize(idx)
-        if cl2.condition[idx] != cl2.cfg.classifier_wildcard and \
-            cl2.behavioral_sequence is None and cl2.effect.enhanced_trace_ga[idx] and \
-                RandomNumberGenerator.random() < mu:
-            cl2.condition.generalize(idx)
\ No newline at end of file
+    with cl1.condition.edit() as condition1, cl2.condition.edit() as condition2:
+        for idx in range(len(condition1)):
+            #
+            if condition1[idx] == cl1.cfg.classifier_wildcard and \
+                condition2[idx] == cl2.cfg.classifier_wildcard:
+                continue
+            #
+            if condition1[idx] != cl1.cfg.classifier_wildcard and \
+                condition2[idx] == cl2.cfg.classifier_wildcard:
+                if RandomNumberGenerator.random() < mu and cl1.effect.enhanced_trace_ga[idx]:
+                    condition1[idx] = cl1.condition.wildcard
+                continue
+            #
+            if condition1[idx] == cl1.cfg.classifier_wildcard and \
+                condition2[idx] != cl2.cfg.classifier_wildcard:
+                if RandomNumberGenerator.random() < mu and cl2.effect.enhanced_trace_ga[idx]:
+                    condition2[idx] = cl2.condition.wildcard
+                continue
+            #
+            if condition1[idx] != cl1.cfg.classifier_wildcard and \
+                cl1.behavioral_sequence is None and cl1.effect.enhanced_trace_ga[idx] and \
+                    RandomNumberGenerator.random() < mu:
+                condition1[idx] = cl1.condition.wildcard
+            if condition2[idx] != cl2.cfg.classifier_wildcard and \
+                cl2.behavioral_sequence is None and cl2.effect.enhanced_trace_ga[idx] and \
+                    RandomNumberGenerator.random() < mu:
+                condition2[idx] = cl2.condition.wildcard
\ No newline at end of file
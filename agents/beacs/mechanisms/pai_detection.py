@@ -39,8 +39,12 @@ def should_pai_detection_apply(
     if match_set is None:
         return False
 
-    overall_time = sum(cl.tbseq * cl.num for cl in match_set)
-    overall_num = sum(cl.num for cl in match_set)
+    overall_time = 0
+    overall_num = 0
+    for cl in match_set:
+        num = cl.num
+        overall_time += cl.tbseq * num
+        overall_num += num
 
     if overall_num == 0:
         return False
@@ -4,6 +4,8 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from typing import Iterable
+
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
 
 from agents.beacs.classifier_components import BEACSClassifier
@@ -37,3 +39,43 @@ def update_classifier_double_q_learning(
         cl.err += beta_rl * (abs(step_reward + gamma * max_fitness_r - cl.r_bis) - cl.err)
         cl.r_bis += beta_rl * (step_reward + gamma * max_fitness_r - cl.r_bis)
     cl.ir += beta_rl * (step_reward - cl.ir)
+
+
+def update_double_q_learning_batch(
+        classifiers: Iterable[BEACSClassifier],
+        step_reward: int,
+        max_fitness_r: float,
+        max_fitness_r_bis: float,
+        beta_rl: float,
+        gamma: float
+    ) -> None:
+    """
+    Applies adapted Double Q-Learning to a set of classifiers, as
+    `update_classifier_double_q_learning` does to each of them in turn.
+    The random numbers choosing the updated reward are drawn in a single call,
+    one per classifier in order, and the targets of the updates are computed
+    once for the set, so that results are identical.
+
+    Parameters
+    ----------
+        classifiers: Iterable[BEACSClassifier]
+        step_reward: int
+        max_fitness_r: float
+        max_fitness_r_bis: float
+        beta_rl: float
+        gamma: float
+    """
+    classifiers = list(classifiers)
+    draws = RandomNumberGenerator.random(size=len(classifiers)).tolist()
+    target_r = step_reward + gamma * max_fitness_r_bis
+    target_r_bis = step_reward + gamma * max_fitness_r
+    for cl, draw in zip(classifiers, draws):
+        if draw < 0.5:
+            delta = target_r - cl.r
+            cl.err += beta_rl * (abs(delta) - cl.err)
+            cl.r += beta_rl * delta
+        else:
+            delta = target_r_bis - cl.r_bis
+            cl.err += beta_rl * (abs(delta) - cl.err)
+            cl.r_bis += beta_rl * delta
+        cl.ir += beta_rl * (step_reward - cl.ir)
@@ -0,0 +1,71 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional
+
+from agents.common.classifier_components.BaseClassifier import BaseClassifier
+
+
+class ActionAggregates:
+    """
+    Aggregates per action of a set of classifiers, computed in a single pass
+    that leaves the set untouched: the numerosity, the numerosity-weighted
+    quality and the classifiers, in their order in the set, advocating each
+    action, along with the first classifier executed the least recently.
+    """
+
+    __slots__ = ['numerosity', 'weighted_quality', 'classifiers', 'latest']
+
+    def __init__(
+            self,
+            classifiers: Iterable[BaseClassifier]
+        ) -> None:
+        numerosity: Dict[int, int] = {}
+        weighted_quality: Dict[int, float] = {}
+        members: Dict[int, List[BaseClassifier]] = {}
+        latest = None
+        latest_talp = None
+        for cl in classifiers:
+            action = cl.action
+            num = cl.num
+            if action in numerosity:
+                numerosity[action] += num
+                weighted_quality[action] += cl.q * num
+                members[action].append(cl)
+            else:
+                numerosity[action] = num
+                weighted_quality[action] = cl.q * num
+                members[action] = [cl]
+            talp = cl.talp
+            if latest is None or talp < latest_talp:
+                latest = cl
+                latest_talp = talp
+        self.numerosity = numerosity
+        self.weighted_quality = weighted_quality
+        self.classifiers = members
+        self.latest: Optional[BaseClassifier] = latest
+
+
+    def knowledge(
+            self,
+            action: int
+        ) -> float:
+        """
+        Returns the average quality of the classifiers advocating the action,
+        or 0 if there is none.
+
+        Parameters
+        ----------
+            action: int
+
+        Returns
+        -------
+        float
+        """
+        if action in self.numerosity:
+            return self.weighted_quality[action] / float(self.numerosity[action])
+        return 0.0
@@ -5,11 +5,23 @@
 """
 
 from collections import namedtuple
-from typing import Callable, List, Tuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
 
 from agents.common.BaseClassifiersList import BaseClassifiersList
 from agents.common.BaseConfiguration import BaseConfiguration
+from agents.common.BufferedGenerator import BufferedGenerator
+from agents.common.ConditionBitmapIndex import ConditionBitmapIndex
+from agents.common.ConditionMatrix import ConditionMatrix
+from agents.common.InterningStore import InterningStore
+from agents.common.LearningScheduler import LearningScheduler
+from agents.common.MatchSetCache import MatchSetCache
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
+from agents.common.SubsumptionIndex import SubsumptionIndex
+from agents.common.SymbolAlphabet import SymbolAlphabet
+from agents.common.mechanisms.cracs import find_subsumers
 
 TrialMetrics = namedtuple('TrialMetrics', ['steps', 'reward'])
 
@@ -22,7 +34,30 @@ class Agent:
             seed) -> None:
         self.cfg = cfg
         self.population = population
-        RandomNumberGenerator.seed(seed)
+        if cfg.match_engine == 'matrix':
+            self.population.set_match_engine(ConditionMatrix(cfg.classifier_length, cfg.classifier_wildcard))
+        elif cfg.match_engine == 'bitmap':
+            self.population.set_match_engine(ConditionBitmapIndex(cfg.classifier_length, cfg.classifier_wildcard))
+        elif cfg.match_engine is not None:
+            raise ValueError(f"Unknown match engine: {cfg.match_engine}")
+        if cfg.ga_selection not in (None, 'numpy', 'numpy_replay'):
+            raise ValueError(f"Unknown GA selection: {cfg.ga_selection}")
+        if cfg.match_set_cache_size > 0:
+            self.population.set_match_set_cache(MatchSetCache(cfg.match_set_cache_size))
+        if cfg.subsumption_index:
+            self.population.set_subsumption_index(SubsumptionIndex())
+        # Own random stream, bound while the agent runs
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        if cfg.rng_block_size > 0:
+            self.rng = BufferedGenerator(self.rng, cfg.rng_block_size)
+        if cfg.learning_time_budget > 0 or cfg.learning_operation_budget > 0:
+            self.scheduler = LearningScheduler(cfg.learning_time_budget, cfg.learning_operation_budget)
+        else:
+            self.scheduler = None
 
 
     def duplicate_population(self) -> BaseClassifiersList:
@@ -54,38 +89,66 @@ class Agent:
         return self.population
 
 
+    @contextmanager
+    def bound(self) -> Iterator[None]:
+        """
+        Binds the random stream of the agent, and the interning store and
+        symbol alphabet of its configuration, as done while the agent runs.
+        Agents run in the same process, even in several threads, thus share
+        no state.
+
+            with agent.bound():
+                ...
+        """
+        with RandomNumberGenerator.bound(self.rng), \
+                InterningStore.bound(self.cfg.interning_store), \
+                SymbolAlphabet.bound(self.cfg.symbol_alphabet):
+            yield
+
+
     def duplicate_population(self)-> BaseClassifiersList:
         raise NotImplementedError("Subclasses should implement this method.")
 
 
-    def apply_CRACS(self, keep_unreliable:bool=True) -> None:
-        # Removing subsumed classifiers and unwanted behavioral classifiers
-        classifiers_to_keep = []
-        for cl in self.population:
-            to_keep = True
-            for other in self.population:
-                if cl != other and other.subsumes(cl):
-                    other.weighted_average_rewards_from_other_cl(cl)
-                    to_keep = False
-                    break
-            if to_keep and cl.behavioral_sequence is not None and \
-                not cl.is_experienced():
-                to_keep = False
-            if to_keep and cl.behavioral_sequence is not None and \
-                not cl.does_anticipate_change() and len(cl.effect)==1:
-                to_keep = False
-            if to_keep and not keep_unreliable and not cl.is_reliable():
-                to_keep = False
-            if to_keep:
-                classifiers_to_keep.append(cl)
-        idx = 0
-        population_length = len(self.population)
-        while(idx < population_length):
-            if self.population[idx] not in classifiers_to_keep:
-                self.population.safe_remove(self.population[idx])
-                idx -= 1
-                population_length -= 1
-            idx += 1
+    def apply_CRACS(self, keep_unreliable:bool=True, processes:int=0) -> Dict[str, int]:
+        """
+        Compacts the population by removing subsumed classifiers and unwanted
+        behavioral classifiers. Subsumers average the rewards of the classifiers
+        they subsume, in population order.
+
+        Parameters
+        ----------
+        keep_unreliable: bool
+        processes: int
+            Number of worker processes used to look for subsumers
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of candidates pruned and of classifiers removed per rule
+        """
+        with self.bound():
+            subsumers, report = find_subsumers(self.population, processes)
+            report.update(subsumed=0, unexperienced=0, no_change=0, unreliable=0)
+            classifiers_to_remove = []
+            for cl in self.population:
+                subsumer = subsumers.get(id(cl))
+                if subsumer is not None:
+                    subsumer.weighted_average_rewards_from_other_cl(cl)
+                    report['subsumed'] += 1
+                elif cl.behavioral_sequence is not None and not cl.is_experienced():
+                    report['unexperienced'] += 1
+                elif cl.behavioral_sequence is not None and \
+                    not cl.does_anticipate_change() and len(cl.effect)==1:
+                    report['no_change'] += 1
+                elif not keep_unreliable and not cl.is_reliable():
+                    report['unreliable'] += 1
+                else:
+                    continue
+                classifiers_to_remove.append(cl)
+            for cl in classifiers_to_remove:
+                self.population.safe_remove(cl)
+        return report
 
 
     def explore(self, env, trials) -> Tuple:
@@ -184,19 +247,31 @@ class Agent:
 
         metrics: List = []
         while current_trial <= max_trials:
-            steps_in_trial, reward = func(env, steps, current_trial)
-            steps += steps_in_trial
-
-            if current_trial % self.get_cfg().metrics_trial_frequency == 0:
-                m = _basic_metrics(current_trial, steps_in_trial, reward)
-                user_metrics = self.get_cfg().user_metrics_collector_fcn
-                if user_metrics is not None:
-                    m.update(user_metrics(self.get_population(), env))
-                metrics.append(m)
+            with self.bound():
+                steps_in_trial, reward = func(env, steps, current_trial)
+                steps += steps_in_trial
+
+                if current_trial % self.get_cfg().metrics_trial_frequency == 0:
+                    m = _basic_metrics(current_trial, steps_in_trial, reward)
+                    user_metrics = self.get_cfg().user_metrics_collector_fcn
+                    if user_metrics is not None:
+                        m.update(user_metrics(self.get_population(), env))
+                    if self.scheduler is not None:
+                        m.update(self.scheduler.trial_metrics())
+                    metrics.append(m)
+
+            store = self.cfg.interning_store
+            if store is not None and store.needs_purge():
+                store.purge(self.population)
 
             current_trial += 1
 
             if decresing_epsilon:
                 self.cfg.epsilon = max(self.cfg.epsilon-(1./max_trials), 0.)
 
+        if self.scheduler is not None:
+            # Deferred learning is completed before the population is returned
+            with self.bound():
+                self.scheduler.flush()
+
         return self.get_population(), metrics
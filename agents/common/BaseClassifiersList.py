@@ -7,14 +7,58 @@
 from __future__ import annotations
 from operator import attrgetter
 from itertools import chain
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Union
+import sys
+
+import numpy as np
 
 from agents.common.BaseConfiguration import BaseConfiguration
+from agents.common.ConditionBitmapIndex import ConditionBitmapIndex
+from agents.common.ConditionMatrix import ConditionMatrix
+from agents.common.MatchSetCache import MatchSetCache
 from agents.common.Perception import Perception
+from agents.common.SubsumptionIndex import SubsumptionIndex
+from agents.common.Transition import Transition
 from agents.common.TypedList import TypedList
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
 
 
+# Attributes of classifiers and components referencing objects shared by the population
+_MEMORY_REPORT_SKIPPED = frozenset(('cfg', '_watchers'))
+
+
+def _attribute_names(obj) -> Iterable[str]:
+    names = list(getattr(obj, '__dict__', ()))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        names.extend((slots, ) if isinstance(slots, str) else slots)
+    return names
+
+
+def _unique_getsizeof(
+        obj,
+        seen: Set[int]
+    ) -> int:
+    """
+    Sums the sys.getsizeof of the object and of the objects it references,
+    counting each object once across calls sharing `seen`.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if obj is None or isinstance(obj, (str, bytes, int, float, np.ndarray)):
+        return size
+    if isinstance(obj, dict):
+        children = chain(obj.keys(), obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        children = obj
+    else:
+        children = (getattr(obj, name) for name in _attribute_names(obj)
+            if name not in _MEMORY_REPORT_SKIPPED and name != '__dict__' and hasattr(obj, name))
+    return size + sum(_unique_getsizeof(child, seen) for child in children)
+
+
 class BaseClassifiersList(TypedList):
     """
     Represents overall population, match/action sets
@@ -22,6 +66,155 @@ class BaseClassifiersList(TypedList):
 
     def __init__(self, oktypes = (BaseClassifier, ), *args) -> None:
         super().__init__(oktypes, *args)
+        self.version = 0
+        self.match_engine: Optional[Union[ConditionMatrix, ConditionBitmapIndex]] = None
+        self.match_set_cache: Optional[MatchSetCache] = None
+        self.subsumption_index: Optional[SubsumptionIndex] = None
+
+
+    def set_match_engine(
+            self,
+            match_engine: Optional[Union[ConditionMatrix, ConditionBitmapIndex]]
+        ) -> None:
+        """
+        Attaches a match engine to the list. The engine is built from
+        the current classifiers and then kept up to date on every insertion
+        and removal. Passing None restores the linear scan.
+
+        Parameters
+        ----------
+        match_engine: Optional[Union[ConditionMatrix, ConditionBitmapIndex]]
+        """
+        self.match_engine = match_engine
+        if match_engine is not None:
+            match_engine.rebuild(self)
+
+
+    def set_match_set_cache(
+            self,
+            match_set_cache: Optional[MatchSetCache]
+        ) -> None:
+        """
+        Attaches a match set cache to the list. Cached entries are patched
+        on every insertion at the end of the list and every removal, and are
+        invalidated by any other structural change. Passing None disables the cache.
+
+        Parameters
+        ----------
+        match_set_cache: Optional[MatchSetCache]
+        """
+        if self.match_set_cache is not None:
+            self.match_set_cache.detach()
+        self.match_set_cache = match_set_cache
+        if match_set_cache is not None:
+            match_set_cache.attach(self)
+
+
+    def set_subsumption_index(
+            self,
+            subsumption_index: Optional[SubsumptionIndex]
+        ) -> None:
+        """
+        Attaches a subsumption index to the list. The index is built from
+        the current classifiers and then kept up to date on every insertion
+        and removal. Passing None restores the linear scan.
+
+        Parameters
+        ----------
+        subsumption_index: Optional[SubsumptionIndex]
+        """
+        self.subsumption_index = subsumption_index
+        if subsumption_index is not None:
+            subsumption_index.rebuild(self)
+
+
+    def subsumption_candidates(
+            self,
+            cl: BaseClassifier
+        ) -> Iterable[BaseClassifier]:
+        """
+        Returns, in list order, the classifiers that may subsume or be equal to `cl`.
+        Without subsumption index, all classifiers of the list are returned.
+
+        Parameters
+        ----------
+        cl: BaseClassifier
+
+        Returns
+        ----------
+        Iterable[BaseClassifier]
+        """
+        if self.subsumption_index is not None:
+            return self.subsumption_index.candidates(cl)
+        return self
+
+
+    def _inserted(self, el, appended: bool) -> None:
+        if not appended:
+            self._reordered()
+            return
+        self.version += 1
+        if self.match_engine is not None:
+            self.match_engine.add(el)
+        if self.subsumption_index is not None:
+            self.subsumption_index.add(el)
+        if self.match_set_cache is not None:
+            self.match_set_cache.classifier_appended(el, self.version)
+
+
+    def _removed(self, el) -> None:
+        self.version += 1
+        if self.match_engine is not None:
+            self.match_engine.remove(el)
+        if self.subsumption_index is not None:
+            self.subsumption_index.remove(el)
+        if self.match_set_cache is not None:
+            self.match_set_cache.classifier_removed(el, self.version)
+
+
+    def _reordered(self) -> None:
+        """
+        Bumps the version and rebuilds the helpers after a change
+        that cannot be handled incrementally.
+        """
+        self.version += 1
+        if self.match_engine is not None:
+            self.match_engine.rebuild(self)
+        if self.subsumption_index is not None:
+            self.subsumption_index.rebuild(self)
+        if self.match_set_cache is not None:
+            self.match_set_cache.attach(self)
+
+
+    def matching(
+            self,
+            situation: Perception
+        ) -> List[BaseClassifier]:
+        """
+        Returns, in list order, all classifiers whose condition matches the situation.
+        The match set cache and the match engine are used when attached to the list.
+        The returned list may be shared with the cache and must not be modified.
+
+        Parameters
+        ----------
+        situation: Perception
+            Current perception
+
+        Returns
+        ----------
+        List[BaseClassifier]
+        """
+        if self.match_set_cache is not None:
+            members = self.match_set_cache.get(situation, self.version)
+            if members is not None:
+                return members
+        if self.match_engine is not None:
+            members = self.match_engine.match(situation)
+        else:
+            members = [cl for cl in self if cl.does_match(situation)]
+        if self.match_set_cache is not None:
+            self.match_set_cache.put(situation, members, self.version)
+        return members
 
 
     def form_match_set(
@@ -42,12 +235,10 @@ class BaseClassifiersList(TypedList):
         The whole set of matching classifiers
         """
         best_fitness = 0.0
-        matching = []
-        for cl in self:
-            if cl.does_match(situation):
-                matching.append(cl)
-                if cl.does_anticipate_change() and cl.fitness > best_fitness:
-                    best_fitness = cl.fitness
+        matching = self.matching(situation)
+        for cl in matching:
+            if cl.does_anticipate_change() and cl.fitness > best_fitness:
+                best_fitness = cl.fitness
         return type(self)(*matching), best_fitness
 
 
@@ -73,12 +264,25 @@ class BaseClassifiersList(TypedList):
         return type(self)(*matching)
     
 
+    def fittest(self) -> Optional[BaseClassifier]:
+        """
+        Returns the first classifier of the list having the highest fitness,
+        reading fitness values cached by the classifiers when they do so.
+
+        Returns
+        ----------
+        Optional[BaseClassifier]
+            None if the list is empty
+        """
+        return max(self, key=attrgetter('fitness'), default=None)
+
+
     def find_best_classifier(
             self,
             situation: Perception,
             have_to_anticipate_changes:bool = True
         ) -> BaseClassifier:
-        return max([cl for cl in self if cl.does_match(situation) and ((not have_to_anticipate_changes) or cl.does_anticipate_change())],key=attrgetter('fitness'),default=None)
+        return max([cl for cl in self.matching(situation) if (not have_to_anticipate_changes) or cl.does_anticipate_change()],key=attrgetter('fitness'),default=None)
 
 
     def expand(self) -> List[BaseClassifier]:
@@ -94,6 +298,35 @@ class BaseClassifiersList(TypedList):
         return list(chain.from_iterable(list2d))
 
 
+    def memory_report(self) -> Dict[str, int]:
+        """
+        Estimates with sys.getsizeof the memory held by the classifiers.
+        Objects shared by several classifiers, such as interned symbols, items
+        of cloned conditions or the empty perception, are counted once, under
+        the first attribute reaching them. Configurations and match engines
+        are not counted.
+
+        Returns
+        -------
+        Dict[str, int]
+            Bytes held by the classifier objects ('classifiers'),
+            by each of their attributes, and in total ('total')
+        """
+        seen = {id(self)}
+        report = {'classifiers': 0}
+        for cl in self:
+            if id(cl) in seen:
+                continue
+            seen.add(id(cl))
+            report['classifiers'] += sys.getsizeof(cl)
+            for name in _attribute_names(cl):
+                if name in _MEMORY_REPORT_SKIPPED or name == '__dict__' or not hasattr(cl, name):
+                    continue
+                report[name] = report.get(name, 0) + _unique_getsizeof(getattr(cl, name), seen)
+        report['total'] = sum(report.values())
+        return report
+
+
     @staticmethod
     def merge_newly_built_classifiers(
             new_list:BaseClassifiersList,
@@ -143,7 +376,8 @@ class BaseClassifiersList(TypedList):
             p1: Perception,
             time: int,
             pai_states_memory,
-            cfg: BaseConfiguration
+            cfg: BaseConfiguration,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles all updates by the ALP,
@@ -164,6 +398,7 @@ class BaseClassifiersList(TypedList):
         time: int
         pai_states_memory
         cfg: BaseConfiguration
+        transition: Optional[Transition]
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
@@ -7,6 +7,9 @@
 from typing import Callable
 
 from agents.common.EnvironmentAdapter import EnvironmentAdapter
+from agents.common.InterningStore import InterningStore
+from agents.common.SymbolAlphabet import SymbolAlphabet
+from agents.common.SymbolBits import SymbolBits
 
 
 class BaseConfiguration():
@@ -31,9 +34,36 @@ class BaseConfiguration():
             theta_as: int=20,
             mu: float=0.3,
             chi: float=0.8,
+            match_engine: str = None,
+            match_set_cache_size: int = 0,
+            subsumption_index: bool = False,
+            symbol_alphabet: SymbolAlphabet = None,
+            sparse_effects: bool = False,
+            interning: bool = False,
+            ga_selection: str = None,
+            rng_block_size: int = 0,
+            learning_time_budget: float = 0.,
+            learning_operation_budget: int = 0,
         ) -> None:
         """
         Creates the configuration object used during training the agent.
+        The seed of the random stream owned by the agent can be a SeedSequence,
+        such as those spawned for several agents by RandomNumberGenerator.spawn.
+        When a symbol alphabet is given, perceptions are expected to be made
+        of its integer codes, the classifier wildcard is replaced by the code
+        of its wildcard and the alphabet renders the symbols of the classifiers.
+        Sparse effects only store their specified attributes.
+        When interning is enabled, the configuration holds an interning store,
+        bound by the agent while it runs, so that equal conditions and effects
+        share canonical items.
+        The GA selection 'numpy' runs the parent selection and the deletion
+        tournaments over arrays, 'numpy_replay' does so with the random draws
+        of the default Python selection.
+        When a RNG block size is given, the agent serves its random draws
+        from blocks of that size drawn in advance.
+        When a learning time budget (in seconds) or operation budget is given,
+        GA applications and PAI detections are deferred and run at the end of
+        the steps within these budgets.
         """
         self.classifier_length = classifier_length
         self.number_of_possible_actions = number_of_possible_actions
@@ -54,6 +84,20 @@ class BaseConfiguration():
         self.theta_as = theta_as
         self.mu = mu
         self.chi = chi
+        self.match_engine = match_engine
+        self.match_set_cache_size = match_set_cache_size
+        self.subsumption_index = subsumption_index
+        self.symbol_alphabet = symbol_alphabet
+        self.sparse_effects = sparse_effects
+        self.interning = interning
+        self.ga_selection = ga_selection
+        self.rng_block_size = rng_block_size
+        self.learning_time_budget = learning_time_budget
+        self.learning_operation_budget = learning_operation_budget
+        self.interning_store = InterningStore() if interning else None
+        if symbol_alphabet is not None:
+            self.classifier_wildcard = symbol_alphabet.wildcard
+        self.symbol_bits = SymbolBits(symbol_alphabet)
 
 
     def __str__(self) -> str:
@@ -80,6 +124,17 @@ class BaseConfiguration():
             "\n\t- Theta_as: [{}]" \
             "\n\t- Mu: [{}]" \
             "\n\t- Chi: [{}]" \
+            "\nPerformance Configuration:" \
+            "\n\t- Match engine: [{}]" \
+            "\n\t- Match set cache size: [{}]" \
+            "\n\t- Subsumption index: [{}]" \
+            "\n\t- Symbol alphabet: [{}]" \
+            "\n\t- Sparse effects: [{}]" \
+            "\n\t- Interning: [{}]" \
+            "\n\t- GA selection: [{}]" \
+            "\n\t- RNG block size: [{}]" \
+            "\n\t- Learning time budget: [{}]" \
+            "\n\t- Learning operation budget: [{}]" \
         .format(
             self.classifier_length,
             self.number_of_possible_actions,
@@ -99,5 +154,15 @@ class BaseConfiguration():
             self.theta_ga,
             self.theta_as,
             self.mu,
-            self.chi
+            self.chi,
+            self.match_engine,
+            self.match_set_cache_size,
+            self.subsumption_index,
+            self.symbol_alphabet,
+            self.sparse_effects,
+            self.interning,
+            self.ga_selection,
+            self.rng_block_size,
+            self.learning_time_budget,
+            self.learning_operation_budget
         )
@@ -0,0 +1,95 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import List
+
+import numpy as np
+
+
+class BufferedGenerator:
+    """
+    Serves the draws of a NumPy generator from blocks drawn in advance,
+    read with a cursor: uniforms from a block of doubles, and bounded
+    integers from a block of raw 64-bit words, scaled by multiplication and shift.
+    The draws only depend on the seed of the generator and on the block size,
+    but differ from the draws of the generator itself.
+    Integer arrays, choices of several items, without replacement or with
+    probabilities are delegated to the generator.
+    """
+
+    __slots__ = ['generator', 'block_size', '_uniforms', '_uniform_cursor', '_words', '_word_cursor']
+
+    def __init__(
+            self,
+            generator: np.random.Generator,
+            block_size: int = 1024
+        ) -> None:
+        self.generator = generator
+        self.block_size = block_size
+        self._uniforms: List[float] = []
+        self._uniform_cursor = 0
+        self._words: List[int] = []
+        self._word_cursor = 0
+
+
+    def _take_uniforms(
+            self,
+            n: int
+        ) -> List[float]:
+        taken = []
+        while n > 0:
+            if self._uniform_cursor == len(self._uniforms):
+                self._uniforms = self.generator.random(self.block_size).tolist()
+                self._uniform_cursor = 0
+            cursor = self._uniform_cursor
+            end = min(cursor + n, len(self._uniforms))
+            taken.extend(self._uniforms[cursor:end])
+            n -= end - cursor
+            self._uniform_cursor = end
+        return taken
+
+
+    def random(self, size=None):
+        if size is None:
+            cursor = self._uniform_cursor
+            if cursor == len(self._uniforms):
+                self._uniforms = self.generator.random(self.block_size).tolist()
+                cursor = 0
+            self._uniform_cursor = cursor + 1
+            return self._uniforms[cursor]
+        return np.array(self._take_uniforms(int(np.prod(size))), dtype=np.float64).reshape(size)
+
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + (high - low) * self.random(size)
+
+
+    def integers(self, low, high=None, size=None, dtype=np.int64, endpoint=False):
+        if size is not None:
+            return self.generator.integers(low, high=high, size=size, dtype=dtype, endpoint=endpoint)
+        if high is None:
+            low, high = 0, low
+        if endpoint:
+            high += 1
+        span = int(high) - int(low)
+        if span <= 0:
+            raise ValueError("high <= 0" if low == 0 else "low >= high")
+        cursor = self._word_cursor
+        if cursor == len(self._words):
+            self._words = self.generator.bit_generator.random_raw(self.block_size).tolist()
+            cursor = 0
+        self._word_cursor = cursor + 1
+        return int(low) + ((self._words[cursor] * span) >> 64)
+
+
+    def choice(self, a, size=None, replace=True, p=None):
+        if size is None and p is None:
+            if isinstance(a, (list, tuple, range)):
+                return a[self.integers(len(a))]
+            if isinstance(a, (int, np.integer)):
+                return self.integers(a)
+        return self.generator.choice(a, size=size, replace=replace, p=p)
@@ -0,0 +1,231 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List
+
+from agents.common.Perception import Perception
+
+
+class ConditionBitmapIndex:
+    """
+    Inverted index match engine dedicated to very large populations.
+    Each classifier owns a slot, and the index keeps one bitmap per
+    (attribute position, symbol) plus one wildcard bitmap per position.
+    A match set is the AND over all positions of the bitmap of the perceived
+    symbol OR'ed with the wildcard bitmap of the position.
+    Bitmaps are Python integers, so that AND operations run in C.
+    The index is maintained incrementally on insertion, removal and
+    modification of watched conditions, and freed slots are reused,
+    so that it never needs a full rebuild.
+    """
+
+    def __init__(
+            self,
+            classifier_length: int,
+            wildcard='#'
+        ) -> None:
+        self.classifier_length = classifier_length
+        self.wildcard = wildcard
+        self._symbol_bitmaps = [{} for _ in range(classifier_length)]
+        self._wildcard_bitmaps = [0] * classifier_length
+        self._alive = 0
+        self._owners = []
+        self._symbols = []
+        self._orders = []
+        self._free_slots = []
+        self._slots = {}
+        self._by_condition = {}
+        self._next_order = 0
+
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+    def _set_bit(
+            self,
+            position: int,
+            symbol,
+            bit: int
+        ) -> None:
+        if symbol == self.wildcard:
+            self._wildcard_bitmaps[position] |= bit
+        else:
+            bitmaps = self._symbol_bitmaps[position]
+            bitmaps[symbol] = bitmaps.get(symbol, 0) | bit
+
+
+    def _clear_bit(
+            self,
+            position: int,
+            symbol,
+            bit: int
+        ) -> None:
+        if symbol == self.wildcard:
+            self._wildcard_bitmaps[position] &= ~bit
+        else:
+            bitmaps = self._symbol_bitmaps[position]
+            remaining = bitmaps[symbol] & ~bit
+            if remaining:
+                bitmaps[symbol] = remaining
+            else:
+                del bitmaps[symbol]
+
+
+    def add(
+            self,
+            cl
+        ) -> None:
+        """
+        Indexes the condition of the classifier in a free slot.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._owners[slot] = cl
+            self._symbols[slot] = cl.condition._items
+            self._orders[slot] = self._next_order
+        else:
+            slot = len(self._owners)
+            self._owners.append(cl)
+            self._symbols.append(cl.condition._items)
+            self._orders.append(self._next_order)
+        self._next_order += 1
+        bit = 1 << slot
+        for position, symbol in enumerate(cl.condition):
+            self._set_bit(position, symbol, bit)
+        self._alive |= bit
+        self._slots[id(cl)] = slot
+        self._by_condition.setdefault(id(cl.condition), []).append(cl)
+        cl.condition.add_watcher(self)
+
+
+    def remove(
+            self,
+            cl
+        ) -> None:
+        """
+        Clears the bits of the classifier and frees its slot.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        slot = self._slots.pop(id(cl), None)
+        if slot is None:
+            return
+        bit = 1 << slot
+        for position, symbol in enumerate(self._symbols[slot]):
+            self._clear_bit(position, symbol, bit)
+        self._alive &= ~bit
+        self._owners[slot] = None
+        self._symbols[slot] = None
+        self._free_slots.append(slot)
+        sharing = self._by_condition.get(id(cl.condition), [])
+        sharing[:] = [other for other in sharing if other is not cl]
+        if not sharing:
+            self._by_condition.pop(id(cl.condition), None)
+            cl.condition.remove_watcher(self)
+
+
+    def condition_changed(
+            self,
+            condition,
+            index,
+            old_value,
+            new_value
+        ) -> None:
+        """
+        Called by a watched condition after one of its attributes was modified.
+        Only the bitmaps of the modified position are updated.
+
+        Parameters
+        ----------
+            condition: Condition
+            index
+            old_value
+            new_value
+        """
+        for cl in self._by_condition.get(id(condition), []):
+            slot = self._slots[id(cl)]
+            bit = 1 << slot
+            if isinstance(index, int):
+                position = index % self.classifier_length
+                self._clear_bit(position, old_value, bit)
+                self._set_bit(position, new_value, bit)
+            else:
+                for position, symbol in enumerate(self._symbols[slot]):
+                    self._clear_bit(position, symbol, bit)
+                for position, symbol in enumerate(condition):
+                    self._set_bit(position, symbol, bit)
+            self._symbols[slot] = condition._items
+
+
+    def contains(
+            self,
+            cl
+        ) -> bool:
+        return id(cl) in self._slots
+
+
+    def rebuild(
+            self,
+            classifiers: Iterable
+        ) -> None:
+        """
+        Rebuilds the whole index from an ordered collection of classifiers.
+        Only needed when the order of the population itself changes.
+
+        Parameters
+        ----------
+            classifiers: Iterable
+        """
+        classifiers = list(classifiers)
+        for sharing in self._by_condition.values():
+            sharing[0].condition.remove_watcher(self)
+        self.__init__(self.classifier_length, self.wildcard)
+        for cl in classifiers:
+            self.add(cl)
+
+
+    def match(
+            self,
+            situation: Perception
+        ) -> List:
+        """
+        Returns, in population order, all classifiers whose condition
+        matches the situation.
+
+        Parameters
+        ----------
+            situation: Perception
+
+        Returns
+        -------
+        List
+        """
+        candidates = self._alive
+        wildcard_bitmaps = self._wildcard_bitmaps
+        symbol_bitmaps = self._symbol_bitmaps
+        for position, symbol in enumerate(situation):
+            if symbol == self.wildcard:
+                continue
+            candidates &= wildcard_bitmaps[position] | symbol_bitmaps[position].get(symbol, 0)
+            if not candidates:
+                return []
+        slots = []
+        while candidates:
+            lowest = candidates & -candidates
+            slots.append(lowest.bit_length() - 1)
+            candidates ^= lowest
+        orders = self._orders
+        slots.sort(key=lambda slot: orders[slot])
+        owners = self._owners
+        return [owners[slot] for slot in slots]
@@ -0,0 +1,246 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List
+
+import numpy as np
+
+from agents.common.Perception import Perception
+
+
+class ConditionMatrix:
+    """
+    Columnar match engine keeping the conditions of a population
+    in a (n_classifiers x classifier_length) integer matrix.
+    Symbols are encoded as small integers the first time they are seen
+    and the wildcard is encoded by a sentinel, so that a match set is
+    computed with one vectorized comparison against the encoded perception.
+    Rows are kept in insertion order so that match sets are returned
+    in the same order as the population. The matrix watches the conditions
+    of its classifiers to re-encode rows modified in place.
+    """
+
+    WILDCARD = -1
+    UNKNOWN = -2
+
+    def __init__(
+            self,
+            classifier_length: int,
+            wildcard='#',
+            capacity: int = 256
+        ) -> None:
+        self.classifier_length = classifier_length
+        self.wildcard = wildcard
+        self._codes = {wildcard: self.WILDCARD}
+        self._matrix = np.empty((capacity, classifier_length), dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._owners = []
+        self._rows = {}
+        self._by_condition = {}
+        self._holes = 0
+
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+    def _encode_symbol(
+            self,
+            symbol
+        ) -> int:
+        code = self._codes.get(symbol)
+        if code is None:
+            code = len(self._codes) - 1
+            self._codes[symbol] = code
+        return code
+
+
+    def encode_perception(
+            self,
+            situation: Perception
+        ) -> np.ndarray:
+        """
+        Encodes a perception with the symbol codes known by the matrix.
+        Symbols never seen in a condition are encoded as UNKNOWN, so that
+        they can only be matched by wildcards.
+
+        Parameters
+        ----------
+            situation: Perception
+
+        Returns
+        -------
+        np.ndarray
+        """
+        get = self._codes.get
+        unknown = self.UNKNOWN
+        return np.fromiter(
+            (get(symbol, unknown) for symbol in situation),
+            dtype=np.int32,
+            count=self.classifier_length
+        )
+
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._alive)
+        matrix = np.empty((capacity, self.classifier_length), dtype=np.int32)
+        matrix[:len(self._owners)] = self._matrix[:len(self._owners)]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._owners)] = self._alive[:len(self._owners)]
+        self._matrix = matrix
+        self._alive = alive
+
+
+    def add(
+            self,
+            cl
+        ) -> None:
+        """
+        Appends the condition of the classifier as the last row of the matrix.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        row = len(self._owners)
+        if row == len(self._alive):
+            self._grow()
+        self._matrix[row] = [self._encode_symbol(symbol) for symbol in cl.condition]
+        self._alive[row] = True
+        self._owners.append(cl)
+        self._rows[id(cl)] = row
+        self._by_condition.setdefault(id(cl.condition), []).append(cl)
+        cl.condition.add_watcher(self)
+
+
+    def remove(
+            self,
+            cl
+        ) -> None:
+        """
+        Removes the row related to the classifier. The row is only
+        marked as dead and the matrix is compacted once enough rows are dead.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        row = self._rows.pop(id(cl), None)
+        if row is None:
+            return
+        self._alive[row] = False
+        self._owners[row] = None
+        self._holes += 1
+        self._unwatch(cl)
+        if self._holes > 64 and self._holes > len(self._rows):
+            self.rebuild(cl for cl in self._owners if cl is not None)
+
+
+    def refresh(
+            self,
+            cl
+        ) -> None:
+        """
+        Re-encodes the row of a classifier whose condition has been modified.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        row = self._rows.get(id(cl))
+        if row is not None:
+            self._matrix[row] = [self._encode_symbol(symbol) for symbol in cl.condition]
+
+
+    def _unwatch(
+            self,
+            cl
+        ) -> None:
+        sharing = self._by_condition.get(id(cl.condition), [])
+        sharing[:] = [other for other in sharing if other is not cl]
+        if not sharing:
+            self._by_condition.pop(id(cl.condition), None)
+            cl.condition.remove_watcher(self)
+
+
+    def condition_changed(
+            self,
+            condition,
+            index,
+            old_value,
+            new_value
+        ) -> None:
+        """
+        Called by a watched condition after one of its attributes was modified.
+
+        Parameters
+        ----------
+            condition: Condition
+            index
+            old_value
+            new_value
+        """
+        for cl in self._by_condition.get(id(condition), []):
+            self.refresh(cl)
+
+
+    def contains(
+            self,
+            cl
+        ) -> bool:
+        return id(cl) in self._rows
+
+
+    def rebuild(
+            self,
+            classifiers: Iterable
+        ) -> None:
+        """
+        Rebuilds the whole matrix from an ordered collection of classifiers.
+
+        Parameters
+        ----------
+            classifiers: Iterable
+        """
+        classifiers = list(classifiers)
+        for sharing in self._by_condition.values():
+            sharing[0].condition.remove_watcher(self)
+        self._owners = []
+        self._rows = {}
+        self._by_condition = {}
+        self._holes = 0
+        self._alive[:] = False
+        for cl in classifiers:
+            self.add(cl)
+
+
+    def match(
+            self,
+            situation: Perception
+        ) -> List:
+        """
+        Returns, in population order, all classifiers whose condition
+        matches the situation.
+
+        Parameters
+        ----------
+            situation: Perception
+
+        Returns
+        -------
+        List
+        """
+        size = len(self._owners)
+        if size == 0:
+            return []
+        encoded = self.encode_perception(situation)
+        conditions = self._matrix[:size]
+        matching = (conditions == encoded) | (conditions == self.WILDCARD)
+        matching |= encoded == self.WILDCARD
+        rows = np.flatnonzero(matching.all(axis=1) & self._alive[:size])
+        owners = self._owners
+        return [owners[row] for row in rows]
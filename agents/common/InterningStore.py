@@ -0,0 +1,205 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional
+
+
+# Leaves of the object graph walked by purge
+_LEAVES = (str, bytes, int, float, complex, type)
+# Attributes shared by the whole agent rather than held by a classifier
+_SHARED = frozenset(('cfg', '_watchers'))
+
+
+class InterningStore:
+    """
+    Hash-consing of the immutable tuples held by conditions and effects.
+    Equal tuples are replaced by a single canonical instance whose hash is
+    computed once, so that identical conditions and effects share their
+    items, are compared by identity and hashed with a lookup by id.
+    Conditions and effects themselves stay distinct, since they are modified.
+    The agent purges the canonical tuples its population no longer reaches
+    whenever the store doubled in size.
+    The store is held by the configuration and bound by the agent while it
+    runs, so that agents run in the same process keep their own store.
+    """
+
+    _bound: ContextVar = ContextVar('InterningStore', default=None)
+
+    def __init__(self) -> None:
+        self._canonical = {}
+        self._hashes = {}
+        self._purge_size = 1024
+        self.hits = 0
+
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+
+    def __reduce__(self):
+        # Canonical tuples are rebuilt by the perceptions of each process
+        return InterningStore, ()
+
+
+    def intern(
+            self,
+            items: tuple
+        ) -> tuple:
+        """
+        Returns the canonical instance of the tuple.
+        Tuples holding mutable items, which are unhashable, are not interned.
+
+        Parameters
+        ----------
+            items: tuple
+
+        Returns
+        -------
+        tuple
+        """
+        try:
+            canonical = self._canonical.get(items)
+        except TypeError:
+            return items
+        if canonical is not None:
+            self.hits += 1
+            return canonical
+        self._canonical[items] = items
+        self._hashes[id(items)] = hash(items)
+        return items
+
+
+    def hash_of(
+            self,
+            items: tuple
+        ) -> int:
+        """
+        Returns the hash of a tuple, precomputed if it is canonical.
+
+        Parameters
+        ----------
+            items: tuple
+
+        Returns
+        -------
+        int
+        """
+        value = self._hashes.get(id(items))
+        if value is None:
+            return hash(items)
+        return value
+
+
+    def needs_purge(self) -> bool:
+        """
+        Tells whether the store doubled in size since it was last purged.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self._canonical) >= self._purge_size
+
+
+    def purge(
+            self,
+            roots: Iterable
+        ) -> None:
+        """
+        Removes the canonical tuples not reachable from the roots, typically
+        the classifiers of the population. Tuples still held elsewhere stay
+        valid and are compared by value, since only their sharing is lost.
+
+        Parameters
+        ----------
+            roots: Iterable
+        """
+        hashes = self._hashes
+        reachable = set()
+        seen = set()
+        stack = list(roots)
+        while stack:
+            obj = stack.pop()
+            if obj is None or isinstance(obj, _LEAVES) or id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, (tuple, list, set, frozenset)):
+                if id(obj) in hashes:
+                    reachable.add(id(obj))
+                stack.extend(obj)
+            elif isinstance(obj, dict):
+                stack.extend(obj.values())
+            else:
+                stack.extend(_attributes(obj))
+        self._canonical = {
+            items: items for items in self._canonical.values() if id(items) in reachable
+        }
+        self._hashes = {key: value for key, value in hashes.items() if key in reachable}
+        self._purge_size = max(1024, 2 * len(self._canonical))
+
+
+    @classmethod
+    def current(cls) -> Optional[InterningStore]:
+        return cls._bound.get()
+
+
+    @classmethod
+    @contextmanager
+    def bound(
+            cls,
+            store: Optional[InterningStore]
+        ) -> Iterator[Optional[InterningStore]]:
+        """
+        Makes the store intern the items of the conditions and effects
+        built in the block. Nothing is interned if the store is None.
+
+        Yields
+        -------
+        Optional[InterningStore]
+        """
+        token = cls._bound.set(store)
+        try:
+            yield store
+        finally:
+            cls._bound.reset(token)
+
+
+    @classmethod
+    def canonical(
+            cls,
+            items: tuple
+        ) -> tuple:
+        """
+        Returns the canonical instance of the tuple in the bound store,
+        or the tuple itself when no store is bound.
+
+        Parameters
+        ----------
+            items: tuple
+
+        Returns
+        -------
+        tuple
+        """
+        store = cls._bound.get()
+        if store is None:
+            return items
+        return store.intern(items)
+
+
+def _attributes(obj) -> Iterator:
+    names = list(getattr(obj, '__dict__', ()))
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    for name in names:
+        if name not in _SHARED and name not in ('__dict__', '__weakref__'):
+            value = getattr(obj, name, None)
+            if not callable(value):
+                yield value
@@ -0,0 +1,118 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from collections import deque
+from time import perf_counter
+from typing import Callable, Dict
+
+
+class LearningScheduler:
+    """
+    Bounds the learning work made in each step of an agent.
+    Deferrable operations, such as GA applications and PAI detection passes,
+    are queued instead of being run at once, and the queue is drained in order
+    at the end of each step until the time budget (in seconds) or the operation
+    budget of the step is spent. A budget of 0 is not enforced.
+    The whole queue is run by flush, when the agent stops running.
+    Deferred operations work on the population as it is when they run,
+    so that learning differs from the one made without the scheduler.
+    """
+
+    def __init__(
+            self,
+            time_budget: float = 0.,
+            operation_budget: int = 0
+        ) -> None:
+        self.time_budget = time_budget
+        self.operation_budget = operation_budget
+        self._queue = deque()
+        self._step = 0
+        self.deferred: Dict[str, int] = {}
+        self.executed: Dict[str, int] = {}
+        self._reset_trial_metrics()
+
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+    def _reset_trial_metrics(self) -> None:
+        self._max_backlog = len(self._queue)
+        self._executed_in_trial = 0
+        self._delay_in_trial = 0
+
+
+    def defer(
+            self,
+            kind: str,
+            operation: Callable,
+            *args
+        ) -> None:
+        """
+        Queues an operation, to be called with the given arguments.
+
+        Parameters
+        ----------
+            kind: str
+                Name of the operation, for instrumentation
+            operation: Callable
+        """
+        self._queue.append((self._step, kind, operation, args))
+        self.deferred[kind] = self.deferred.get(kind, 0) + 1
+        self._max_backlog = max(self._max_backlog, len(self._queue))
+
+
+    def _run_next(self) -> None:
+        step, kind, operation, args = self._queue.popleft()
+        operation(*args)
+        self.executed[kind] = self.executed.get(kind, 0) + 1
+        self._executed_in_trial += 1
+        self._delay_in_trial += self._step - step
+
+
+    def end_step(self) -> None:
+        """
+        Runs queued operations within the budgets of the step.
+        """
+        start = perf_counter()
+        operations = 0
+        while self._queue:
+            if self.operation_budget > 0 and operations >= self.operation_budget:
+                break
+            if self.time_budget > 0 and perf_counter() - start >= self.time_budget:
+                break
+            self._run_next()
+            operations += 1
+        self._step += 1
+
+
+    def flush(self) -> None:
+        """
+        Runs all the queued operations.
+        """
+        while self._queue:
+            self._run_next()
+
+
+    def trial_metrics(self) -> Dict[str, float]:
+        """
+        Returns the instrumentation of the trials since the last call:
+        the backlog left and the largest one, the number of deferred operations
+        run and the mean number of steps they waited for.
+
+        Returns
+        -------
+        Dict[str, float]
+        """
+        metrics = {
+            'deferred_backlog': len(self._queue),
+            'deferred_max_backlog': self._max_backlog,
+            'deferred_executed': self._executed_in_trial,
+            'deferred_mean_delay': self._delay_in_trial / self._executed_in_trial if self._executed_in_trial else 0.
+        }
+        self._reset_trial_metrics()
+        return metrics
@@ -0,0 +1,206 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Optional
+if TYPE_CHECKING:
+    from agents.common.BaseClassifiersList import BaseClassifiersList
+
+from agents.common.Perception import Perception
+
+
+class MatchSetCache:
+    """
+    Memoizes the members of the match sets of a population, keyed by perception.
+    Each entry is stamped with the population version it is valid for.
+    Appending or removing a classifier patches the valid entries and stamps
+    them with the new version, while any other structural change of the
+    population (reordering, modification of a condition) only bumps the
+    version, so that all entries become stale.
+    """
+
+    def __init__(
+            self,
+            size: int = 1024
+        ) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._watched = {}
+        self._population: Optional[BaseClassifiersList] = None
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def attach(
+            self,
+            population: BaseClassifiersList
+        ) -> None:
+        """
+        Binds the cache to a population and watches the conditions of its classifiers.
+
+        Parameters
+        ----------
+            population: BaseClassifiersList
+        """
+        self.detach()
+        self._population = population
+        for cl in population:
+            self.watch(cl)
+
+
+    def detach(self) -> None:
+        """
+        Stops watching the conditions registered by the cache, including those
+        of classifiers no longer in the population, and empties the cache.
+        """
+        for condition, _ in self._watched.values():
+            condition.remove_watcher(self)
+        self._population = None
+        self._watched = {}
+        self._entries = {}
+
+
+    def watch(
+            self,
+            cl
+        ) -> None:
+        condition = cl.condition
+        watched = self._watched.get(id(condition))
+        if watched is None:
+            self._watched[id(condition)] = [condition, 1]
+            condition.add_watcher(self)
+        else:
+            watched[1] += 1
+
+
+    def unwatch(
+            self,
+            cl
+        ) -> None:
+        key = id(cl.condition)
+        watched = self._watched.get(key)
+        if watched is None:
+            return
+        watched[1] -= 1
+        if watched[1] <= 0:
+            del self._watched[key]
+            watched[0].remove_watcher(self)
+
+
+    def condition_changed(
+            self,
+            condition,
+            index,
+            old_value,
+            new_value
+        ) -> None:
+        """
+        Called by a watched condition after one of its attributes was modified.
+        The population version is bumped so that all entries become stale.
+        """
+        if self._population is not None:
+            self._population.version += 1
+        self._entries = {}
+
+
+    def get(
+            self,
+            situation: Perception,
+            version: int
+        ) -> Optional[List]:
+        """
+        Returns the cached members of the match set related to the situation,
+        or None if there is no entry valid for the given population version.
+
+        Parameters
+        ----------
+            situation: Perception
+            version: int
+
+        Returns
+        -------
+        Optional[List]
+        """
+        entry = self._entries.get(tuple(situation))
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+
+    def put(
+            self,
+            situation: Perception,
+            members: List,
+            version: int
+        ) -> None:
+        """
+        Stores the members of the match set related to the situation.
+        The oldest entry is discarded when the cache is full.
+
+        Parameters
+        ----------
+            situation: Perception
+            members: List
+            version: int
+        """
+        key = tuple(situation)
+        if key not in self._entries and len(self._entries) >= self.size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = [version, list(members), {id(cl) for cl in members}]
+
+
+    def classifier_appended(
+            self,
+            cl,
+            version: int
+        ) -> None:
+        """
+        Patches the entries valid before the insertion of a classifier
+        at the end of the population.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+            version: int
+                Population version after the insertion
+        """
+        self.watch(cl)
+        for key, entry in self._entries.items():
+            if entry[0] == version - 1:
+                if cl.does_match(key):
+                    entry[1].append(cl)
+                    entry[2].add(id(cl))
+                entry[0] = version
+
+
+    def classifier_removed(
+            self,
+            cl,
+            version: int
+        ) -> None:
+        """
+        Patches the entries valid before the removal of a classifier.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+            version: int
+                Population version after the removal
+        """
+        self.unwatch(cl)
+        cl_id = id(cl)
+        for entry in self._entries.values():
+            if entry[0] == version - 1:
+                if cl_id in entry[2]:
+                    entry[1] = [other for other in entry[1] if other is not cl]
+                    entry[2].discard(cl_id)
+                entry[0] = version
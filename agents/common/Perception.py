@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import collections.abc
 
+from agents.common.SymbolAlphabet import render_symbol
+
 
 class Perception(collections.abc.Sequence):
     """
     Represents current state of the environment at given time instance.
-    By default each environment attribute is represented as `str` type.
+    By default each environment attribute is represented as `str` type,
+    or as an `int` code when a symbol alphabet is used.
+    Perceptions are never modified, so the empty perception is a shared sentinel.
     """
 
     __slots__ = ['_items', 'oktypes']
 
-    def __init__(self, observation, oktypes=(str,)) -> None:
+    def __init__(self, observation, oktypes=(str, int)) -> None:
         self._items = list()
 
         for el in observation:
@@ -22,7 +26,11 @@ class Perception(collections.abc.Sequence):
 
     @classmethod
     def empty(cls) -> Perception:
-        return cls([], oktypes=(None,))
+        empty = cls.__dict__.get('_empty')
+        if empty is None:
+            empty = cls([], oktypes=(None,))
+            cls._empty = empty
+        return empty
 
     def is_empty(self) -> bool:
         return len(self._items) == 0
@@ -34,7 +42,7 @@ class Perception(collections.abc.Sequence):
         return len(self._items)
 
     def __repr__(self) -> str:
-        return ''.join(map(str, self))
+        return ''.join(map(render_symbol, self))
 
     def __eq__(self, other) -> bool:
         if len(self) != len(other):
@@ -4,6 +4,10 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List
+
 import numpy as np
 
 
@@ -15,25 +19,76 @@ class Singleton(object):
         return cls._instance
 
 class RandomNumberGenerator(Singleton):
+    """
+    Draws random numbers from the generator bound to the current context,
+    which agents bind to their own generator while they run, or else from
+    the process-wide generator. Context variables are specific to each thread,
+    so that agents run in several threads each draw from their own stream.
+    The bound generator can be a BufferedGenerator.
+    """
 
     rng = np.random.default_rng()
 
+    _bound: ContextVar = ContextVar('RandomNumberGenerator', default=None)
+
     @classmethod
     def seed(cls, seed) -> None:
         cls.rng = np.random.default_rng(seed)
 
     @classmethod
-    def random(cls):
-        return cls.rng.random()
-    
+    def current(cls) -> np.random.Generator:
+        rng = cls._bound.get()
+        if rng is None:
+            return cls.rng
+        return rng
+
+    @classmethod
+    @contextmanager
+    def bound(cls, rng: np.random.Generator) -> Iterator[np.random.Generator]:
+        """
+        Makes the draws of the block come from `rng`.
+
+            with RandomNumberGenerator.bound(agent.rng):
+                ...
+
+        Yields
+        -------
+        np.random.Generator
+        """
+        token = cls._bound.set(rng)
+        try:
+            yield rng
+        finally:
+            cls._bound.reset(token)
+
+    @staticmethod
+    def spawn(seed, n: int) -> List[np.random.SeedSequence]:
+        """
+        Returns `n` independent seed sequences spawned from `seed`,
+        to be given as seeds to the configurations of `n` agents.
+
+        Returns
+        -------
+        List[np.random.SeedSequence]
+        """
+        return np.random.SeedSequence(seed).spawn(n)
+
+    @classmethod
+    def random(cls, size=None):
+        return cls.current().random(size=size)
+
     @classmethod
     def choice(cls, a, size=None, replace=True, p=None):
-        return cls.rng.choice(a, size=size, replace=replace, p=p)
-    
+        rng = cls.current()
+        if size is None and p is None and isinstance(a, (list, tuple)):
+            # Same draw as the generator, without converting the sequence to an array
+            return a[rng.integers(len(a))]
+        return rng.choice(a, size=size, replace=replace, p=p)
+
     @classmethod
     def integers(cls, low, high=None, size=None, dtype=np.int64, endpoint=False):
-        return cls.rng.integers(low, high=high, size=size, dtype=dtype, endpoint=endpoint)
-    
+        return cls.current().integers(low, high=high, size=size, dtype=dtype, endpoint=endpoint)
+
     @classmethod
     def uniform(cls, low=0.0, high=1.0, size=None):
-        return cls.rng.uniform(low=low, high=high, size=size)
\ No newline at end of file
+        return cls.current().uniform(low=low, high=high, size=size)
@@ -0,0 +1,142 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Iterable
+
+
+class SubsumptionIndex:
+    """
+    Hash index of a population used by the ALP and the GA to look for
+    the classifiers that may subsume or be equal to an insertion candidate.
+    A classifier can only subsume another one sharing its action and its
+    behavioral sequence and whose effect it subsumes, so classifiers are
+    bucketed by (action, behavioral sequence, effect signature).
+    Buckets keep the insertion order, so that candidates are visited
+    in the same order as in the population.
+    """
+
+    def __init__(self) -> None:
+        self._buckets = {}
+        self._keys = {}
+
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+    @staticmethod
+    def _prefix(cl) -> tuple:
+        if cl.behavioral_sequence is None:
+            return (cl.action, None)
+        return (cl.action, tuple(cl.behavioral_sequence))
+
+
+    @classmethod
+    def lookup_key(
+            cls,
+            cl
+        ) -> tuple:
+        """
+        Returns the key of the bucket holding the classifiers
+        that may subsume or be equal to the classifier.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+
+        Returns
+        -------
+        tuple
+        """
+        return cls._prefix(cl) + (cl.effect.signatures()[0], )
+
+
+    def add(
+            self,
+            cl
+        ) -> None:
+        """
+        Indexes the classifier under all signatures of its effect.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        entry = self._keys.get(id(cl))
+        if entry is not None:
+            entry[1] += 1
+            return
+        prefix = self._prefix(cl)
+        keys = [prefix + (signature, ) for signature in cl.effect.signatures()]
+        self._keys[id(cl)] = [keys, 1]
+        for key in keys:
+            self._buckets.setdefault(key, {})[id(cl)] = cl
+
+
+    def remove(
+            self,
+            cl
+        ) -> None:
+        """
+        Removes the classifier from the buckets it was indexed in.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+        """
+        entry = self._keys.get(id(cl))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._keys[id(cl)]
+        for key in entry[0]:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.pop(id(cl), None)
+                if not bucket:
+                    del self._buckets[key]
+
+
+    def rebuild(
+            self,
+            classifiers: Iterable
+        ) -> None:
+        """
+        Rebuilds the whole index from an ordered collection of classifiers.
+
+        Parameters
+        ----------
+            classifiers: Iterable
+        """
+        self._buckets = {}
+        self._keys = {}
+        for cl in classifiers:
+            self.add(cl)
+
+
+    def candidates(
+            self,
+            cl
+        ) -> Iterable:
+        """
+        Returns, in population order, the classifiers that may subsume
+        or be equal to the classifier.
+
+        Parameters
+        ----------
+            cl: BaseClassifier
+
+        Returns
+        -------
+        Iterable
+        """
+        bucket = self._buckets.get(self.lookup_key(cl))
+        if bucket is None:
+            return ()
+        return bucket.values()
@@ -0,0 +1,143 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Mapping, Optional, Union
+
+
+class SymbolAlphabet:
+    """
+    Opt-in integer coding of the perception symbols.
+    Perceptions, conditions, effects and marks then hold small integers,
+    which are cached by the interpreter and compared faster than strings,
+    and the wildcard is an integer code as well. Symbols are only rendered
+    as strings by __repr__, through the bound alphabet.
+    The alphabet is held by the configuration. Classifiers bind the alphabet
+    of their configuration to render their symbols, and agents bind it while
+    they run, so that agents run in the same process keep their own alphabet.
+    """
+
+    _bound: ContextVar = ContextVar('SymbolAlphabet', default=None)
+
+    def __init__(
+            self,
+            symbols: Union[Mapping[int, str], Iterable[str]],
+            wildcard: str = '#',
+            wildcard_code: int = -1
+        ) -> None:
+        """
+        Parameters
+        ----------
+            symbols: Union[Mapping[int, str], Iterable[str]]
+                Rendering of each code. Codes are the positions of the symbols
+                when an iterable is given, e.g. use {0: '0', 1: '1', 9: '9'}
+                to keep the integer values of maze observations.
+            wildcard: str
+            wildcard_code: int
+        """
+        if not isinstance(symbols, Mapping):
+            symbols = dict(enumerate(symbols))
+        if wildcard_code in symbols:
+            raise ValueError(f"Wildcard code {wildcard_code} is already used by a symbol")
+        self.renderings = {code: str(symbol) for code, symbol in symbols.items()}
+        self.renderings[wildcard_code] = wildcard
+        self.codes = {rendering: code for code, rendering in self.renderings.items()}
+        self.wildcard = wildcard_code
+
+
+    def __len__(self) -> int:
+        return len(self.renderings) - 1
+
+
+    def encode(
+            self,
+            observation: Iterable
+        ) -> tuple:
+        """
+        Converts an observation made of rendered symbols to codes.
+
+        Parameters
+        ----------
+            observation: Iterable
+
+        Returns
+        -------
+        tuple
+        """
+        codes = self.codes
+        return tuple(codes[str(symbol)] for symbol in observation)
+
+
+    def decode(
+            self,
+            observation: Iterable
+        ) -> tuple:
+        """
+        Converts an observation made of codes to rendered symbols.
+
+        Parameters
+        ----------
+            observation: Iterable
+
+        Returns
+        -------
+        tuple
+        """
+        return tuple(self.render(symbol) for symbol in observation)
+
+
+    def render(
+            self,
+            symbol
+        ) -> str:
+        return self.renderings.get(symbol, str(symbol))
+
+
+    @classmethod
+    def current(cls) -> Optional[SymbolAlphabet]:
+        return cls._bound.get()
+
+
+    @classmethod
+    @contextmanager
+    def bound(
+            cls,
+            alphabet: Optional[SymbolAlphabet]
+        ) -> Iterator[Optional[SymbolAlphabet]]:
+        """
+        Makes the symbols rendered in the block be decoded with the alphabet.
+        Integer symbols are rendered as such if the alphabet is None.
+
+        Yields
+        -------
+        Optional[SymbolAlphabet]
+        """
+        token = cls._bound.set(alphabet)
+        try:
+            yield alphabet
+        finally:
+            cls._bound.reset(token)
+
+
+def render_symbol(symbol) -> str:
+    """
+    Renders a perception symbol, decoding integer symbols
+    with the bound alphabet if any.
+
+    Parameters
+    ----------
+        symbol
+
+    Returns
+    -------
+    str
+    """
+    alphabet = SymbolAlphabet._bound.get()
+    if alphabet is None or not isinstance(symbol, int):
+        return str(symbol)
+    return alphabet.render(symbol)
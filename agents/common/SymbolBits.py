@@ -0,0 +1,73 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from threading import Lock
+from typing import List, Optional
+
+from agents.common.SymbolAlphabet import SymbolAlphabet
+
+
+class SymbolBits:
+    """
+    Bit of each perception symbol in the masks of the marks of the classifiers
+    sharing a configuration, which holds it.
+    Symbols are given the next bit when they are first marked. With a symbol
+    alphabet, its codes are given the first bits in increasing order up front,
+    so that masks are no wider than the alphabet.
+    Bits are given under a lock, so that agents sharing the configuration
+    in several threads never give the same bit to distinct symbols.
+    """
+
+    def __init__(
+            self,
+            alphabet: Optional[SymbolAlphabet] = None
+        ) -> None:
+        self.bits = {}
+        self.symbols: List = []
+        self._lock = Lock()
+        if alphabet is not None:
+            for code in sorted(alphabet.renderings):
+                if code != alphabet.wildcard:
+                    self.register(code)
+
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+    def __getstate__(self):
+        return self.bits, self.symbols
+
+
+    def __setstate__(self, state) -> None:
+        self.bits, self.symbols = state
+        self._lock = Lock()
+
+
+    def register(
+            self,
+            symbol
+        ) -> int:
+        """
+        Returns the bit of the symbol, giving it the next bit if it has none.
+
+        Parameters
+        ----------
+            symbol
+
+        Returns
+        -------
+        int
+        """
+        with self._lock:
+            bit = self.bits.get(symbol)
+            if bit is None:
+                bit = 1 << len(self.symbols)
+                # Symbols are counted once their bit is visible
+                self.bits[symbol] = bit
+                self.symbols.append(symbol)
+            return bit
@@ -0,0 +1,40 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from typing import Optional, Tuple
+
+from agents.common.Perception import Perception
+
+
+class Transition:
+    """
+    Change of the environment from `p0` to `p1` observed in a step,
+    computed once and shared by all the classifiers of the action set
+    during the anticipatory learning process.
+    """
+
+    __slots__ = ['p0', 'p1', 'p0_items', 'p1_items', 'changed', 'changed_indices', 'p0_bits', 'p0_bits_symbols']
+
+    def __init__(
+            self,
+            p0: Perception,
+            p1: Perception
+        ) -> None:
+        self.p0 = p0
+        self.p1 = p1
+        self.p0_items = tuple(p0)
+        self.p1_items = tuple(p1)
+        # Attributes whose value changed from p0 to p1
+        self.changed: Tuple[bool, ...] = tuple(p0i != p1i for p0i, p1i in zip(self.p0_items, self.p1_items))
+        self.changed_indices: Tuple[int, ...] = tuple(idx for idx, changed in enumerate(self.changed) if changed)
+        # Mark bits of the symbols of p0, set and kept up to date by PMark
+        self.p0_bits: Optional[Tuple[int, ...]] = None
+        self.p0_bits_symbols = 0
+
+
+    def __repr__(self) -> str:
+        return f"{self.p0!r} -> {self.p1!r}"
@@ -1,9 +1,29 @@
 import collections.abc
 
 
+# Marks the slot of a removed element until the list is compacted
+_HOLE = object()
+
+
 class TypedList(collections.abc.MutableSequence):
+    """
+    Mutable sequence checking the type of its elements.
+
+    Elements are indexed by identity, so that `safe_remove` and
+    membership tests are O(1). Removed elements leave a hole in the
+    underlying list, which is compacted lazily on positional access or
+    once holes outnumber elements, so that the iteration order is always
+    the insertion order.
 
-    __slots__ = ['_items', 'oktypes']
+    Elements may be removed during an iteration: an element removed before
+    the iteration reaches it is not yielded, unless the list holds it again,
+    and no other element is skipped, whereas a plain list skips the element
+    following the removed one. Elements appended during an iteration are only
+    reached if the list is not compacted meanwhile. Other insertions and
+    reorderings during an iteration are not supported.
+    """
+
+    __slots__ = ['_items', 'oktypes', '_positions', '_holes', '_duplicates']
 
     def __init__(self, oktypes, *args) -> None:
         self._items = list()
@@ -14,41 +34,122 @@ class TypedList(collections.abc.MutableSequence):
                 raise TypeError(f"Wrong element type: object {el}, type {type(el)}")
 
         self._items.extend(list(args))
+        self._holes = 0
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._positions = {}
+        for position, el in enumerate(self._items):
+            if el is not _HOLE:
+                self._positions.setdefault(id(el), position)
+        self._duplicates = len(self._items) - self._holes - len(self._positions)
+
+    def _compact(self) -> None:
+        if self._holes:
+            self._items = [el for el in self._items if el is not _HOLE]
+            self._holes = 0
+            self._reindex()
+
+    def _inserted(self, el, appended: bool) -> None:
+        """
+        Called after an element was inserted. Subclasses can override it
+        to maintain auxiliary structures.
+        """
+
+    def _removed(self, el) -> None:
+        """
+        Called after an element was removed. Subclasses can override it
+        to maintain auxiliary structures.
+        """
+
+    def _reordered(self) -> None:
+        """
+        Called after a change that cannot be described as an insertion
+        or a removal (sort, replacement, slice deletion).
+        """
 
     def insert(self, index: int, el) -> None:
         if not isinstance(el, self.oktypes):
             raise TypeError(f"Wrong element type: object {el}, type {type(el)}")
-        self._items.insert(index, el)
+        if index >= len(self):
+            self._items.append(el)
+            if id(el) in self._positions:
+                self._duplicates += 1
+            else:
+                self._positions[id(el)] = len(self._items) - 1
+            self._inserted(el, True)
+        else:
+            self._compact()
+            self._items.insert(index, el)
+            self._reindex()
+            self._inserted(el, False)
+
+    def _remove_at(self, position: int) -> None:
+        el = self._items[position]
+        self._items[position] = _HOLE
+        self._holes += 1
+        if self._positions.get(id(el)) == position:
+            del self._positions[id(el)]
+        if self._duplicates or (self._holes > 32 and self._holes > len(self._items) // 2):
+            self._compact()
+        self._removed(el)
 
     def safe_remove(self, o) -> None:
-        try:
-            self.remove(o)
-        except ValueError:
-            pass
+        """
+        Removes the element `o` itself (identity, not equality) if present.
+        """
+        position = self._positions.get(id(o))
+        if position is not None:
+            self._remove_at(position)
 
     def sort(self, *args, **kwargs) -> None:
+        self._compact()
         self._items.sort(*args, **kwargs)
+        self._reindex()
+        self._reordered()
+
+    def __contains__(self, el) -> bool:
+        return id(el) in self._positions
+
+    def __iter__(self):
+        # Removals made while iterating write holes, or compact the list,
+        # in which case removed elements are no longer indexed
+        items = self._items
+        for el in items:
+            if el is not _HOLE and (self._items is items or id(el) in self._positions):
+                yield el
 
     def __repr__(self) -> str:
-        return f"{len(self._items)} items"
+        return f"{len(self)} items"
 
     def __setitem__(self, i, el) -> None:
         if not isinstance(el, self.oktypes):
             raise TypeError(f"Wrong element type: object {el}, type {type(el)}")
+        self._compact()
         self._items[i] = el
+        self._reindex()
+        self._reordered()
 
     def __delitem__(self, i) -> None:
-        del self._items[i]
+        self._compact()
+        if isinstance(i, int):
+            self._remove_at(range(len(self._items))[i])
+        else:
+            del self._items[i]
+            self._reindex()
+            self._reordered()
 
     def __getitem__(self, i):
+        if self._holes:
+            self._compact()
         return self._items[i]
 
     def __len__(self) -> int:
-        return len(self._items)
+        return len(self._items) - self._holes
 
     def __hash__(self) -> int:
         return hash((self.oktypes, self._items))
 
     def __eq__(self, o) -> bool:
         return self.oktypes == o.oktypes \
-            and self._items == o._items
+            and list(self) == list(o)
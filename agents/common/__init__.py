@@ -7,7 +7,9 @@
 from .TypedList import TypedList
 from .RandomNumberGenerator import RandomNumberGenerator
 from .Perception import Perception
+from .Transition import Transition
 from .EnvironmentAdapter import EnvironmentAdapter
+from .SymbolAlphabet import SymbolAlphabet
 from .BaseConfiguration import BaseConfiguration
 from .BaseClassifiersList import BaseClassifiersList
 from .Agent import Agent
\ No newline at end of file
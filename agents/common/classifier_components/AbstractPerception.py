@@ -1,14 +1,21 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from copy import copy
+from typing import Iterator, List
+
+from agents.common.InterningStore import InterningStore
+from agents.common.SymbolAlphabet import render_symbol
 
 class AbstractPerception:
 
+    __slots__ = ['_items', 'wildcard']
+
     def __init__(
             self,
             observation,
             wildcard='#'
         ) -> None:
-        self._items = tuple(observation)
+        self._items = InterningStore.canonical(tuple(observation))
         self.wildcard = wildcard
 
     @classmethod
@@ -32,7 +39,21 @@ class AbstractPerception:
         AbstractPerception
         """
         ps_str = [copy(wildcard) for _ in range(length)]
-        return cls(ps_str)
+        return cls(ps_str, wildcard=wildcard)
+
+    def clone(self) -> AbstractPerception:
+        """
+        Returns a copy sharing the immutable items, which are only
+        replaced, never modified, by later modifications of either copy.
+
+        Returns
+        -------
+        AbstractPerception
+        """
+        cloned = object.__new__(type(self))
+        cloned._items = self._items
+        cloned.wildcard = self.wildcard
+        return cloned
 
     def __iter__(self):
         return iter(self._items)
@@ -46,16 +67,47 @@ class AbstractPerception:
     def __setitem__(self, index, value) -> None:
         lst = list(self._items)
         lst[index] = value
-        self._items = tuple(lst)
+        self._items = InterningStore.canonical(tuple(lst))
+
+    @contextmanager
+    def edit(self) -> Iterator[List]:
+        """
+        Buffers a batch of modifications in a mutable list of the items,
+        which replaces the items once when the block exits without error.
+        Setting items one by one rebuilds the items at each modification.
+
+            with condition.edit() as items:
+                items[0] = '1'
+
+        Yields
+        -------
+        List
+        """
+        items = list(self._items)
+        yield items
+        self._assign(items)
+
+    def _assign(self, items: List) -> None:
+        """
+        Replaces all the items. Subclasses can override it
+        to maintain auxiliary structures.
+        """
+        self._items = InterningStore.canonical(tuple(items))
 
     def __eq__(self, other) -> bool:
-        return self._items == other._items
+        # Interned items are equal if and only if they are identical
+        items = self._items
+        other_items = other._items
+        return items is other_items or items == other_items
 
     def __hash__(self) -> int:
+        store = InterningStore.current()
+        if store is not None:
+            return store.hash_of(self._items)
         return hash(self._items)
 
     def __repr__(self) -> str:
-        return '.'.join(map(str, self._items))
+        return '.'.join(map(render_symbol, self._items))
 
     def __str__(self) -> str:
-        return '.'.join(str(attr) for attr in self)
\ No newline at end of file
+        return '.'.join(render_symbol(attr) for attr in self)
\ No newline at end of file
@@ -8,10 +8,13 @@ from __future__ import annotations
 from typing import Optional, Union, List
 
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.BaseConfiguration import BaseConfiguration
+from agents.common.SymbolAlphabet import SymbolAlphabet
 from agents.common.classifier_components.Condition import Condition
 from agents.common.classifier_components.PMark import PMark
 from agents.common.classifier_components.Effect import Effect
+from agents.common.classifier_components.SparseEffect import SparseEffect
 
 
 class BaseClassifier:
@@ -50,7 +53,7 @@ class BaseClassifier:
         self.condition = _build_perception_string(Condition, condition)
         self.action = action
         self.behavioral_sequence = behavioral_sequence
-        self.effect = _build_perception_string(Effect, effect)
+        self.effect = _build_perception_string(SparseEffect if cfg.sparse_effects else Effect, effect)
         self.mark = PMark(cfg=self.cfg)
         self.q = quality
         self.r = reward
@@ -81,6 +84,11 @@ class BaseClassifier:
 
 
     def __repr__(self) -> str:
+        with SymbolAlphabet.bound(self.cfg.symbol_alphabet):
+            return self._render()
+
+
+    def _render(self) -> str:
         return f"C:{self.condition} A:{self.action} {str(self.behavioral_sequence)} E:{str(self.effect)}\n" \
             f"q: {self.q:<6.4} r: {self.r:<6.4} ir: {self.ir:<6.4} f: {self.fitness:<6.4}\n" \
             f"exp: {self.exp:<5} num: {self.num} ee: {self.ee}\n" \
@@ -108,7 +116,7 @@ class BaseClassifier:
         new_cls = BaseClassifier(
             condition=Condition(self.condition, self.cfg.classifier_wildcard),
             action=self.action,
-            effect=Effect(self.effect, self.cfg.classifier_wildcard),
+            effect=self.effect.clone(),
             behavioral_sequence=self.behavioral_sequence,
             quality=self.q,
             reward=self.r,
@@ -275,7 +283,8 @@ class BaseClassifier:
     def is_specializable(
             self,
             previous_situation: Perception,
-            situation: Perception
+            situation: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if both effect and condition can be modified to
@@ -285,12 +294,14 @@ class BaseClassifier:
         ----------
             previous_situation: Perception
             situation: Perception
+            transition: Optional[Transition]
+                Transition between both situations, if already computed
 
         Returns
         -------
         bool
         """
-        return self.effect.is_specializable(previous_situation, situation)
+        return self.effect.is_specializable(previous_situation, situation, transition)
 
 
     def does_anticipate_change(self) -> bool:
@@ -325,7 +336,8 @@ class BaseClassifier:
     def does_anticipate_correctly(
             self,
             previous_situation: Perception,
-            situation: Perception
+            situation: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Checks anticipation. While the pass-through symbols in the effect part
@@ -339,19 +351,22 @@ class BaseClassifier:
         ----------
             previous_situation: Perception
             situation: Perception
+            transition: Optional[Transition]
+                Transition between both situations, if already computed
 
         Returns
         -------
         bool
         """
-        return self.effect.does_anticipate_correctly(previous_situation, situation)
+        return self.effect.does_anticipate_correctly(previous_situation, situation, transition)
 
 
     def does_predict_successfully(
             self,
             p0: Perception,
             action: int,
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Checks if classifier matches previous situation `p0`,
@@ -364,6 +379,8 @@ class BaseClassifier:
             p0: Perception
             action: int
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, to share between classifiers
 
         Returns
         -------
@@ -371,7 +388,7 @@ class BaseClassifier:
         """
         if self.does_match(p0):
             if self.action == action:
-                if self.does_anticipate_correctly(p0, p1):
+                if self.does_anticipate_correctly(p0, p1, transition=transition):
                     return True
         return False
 
@@ -399,7 +416,8 @@ class BaseClassifier:
 
     def set_mark(
             self,
-            perception: Perception
+            perception: Perception,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         Specializes the mark in all attributes.
@@ -407,8 +425,10 @@ class BaseClassifier:
         Parameters
         ----------
             perception: Perception
+            transition: Optional[Transition]
+                Transition starting from `perception`, if already computed
         """
-        self.ee = self.mark.set_mark(perception, self.ee)
+        self.ee = self.mark.set_mark(perception, self.ee, transition)
 
 
     def set_alp_timestamp(
@@ -444,10 +464,11 @@ class BaseClassifier:
             previous_situation: Perception
             situation: Perception
         """
-        for idx in range(self.cfg.classifier_length):
-            if previous_situation[idx] != situation[idx] and self.effect[idx] == self.cfg.classifier_wildcard:
-                self.effect[idx] = situation[idx]
-                self.condition[idx] = previous_situation[idx]
+        with self.condition.edit() as condition, self.effect.edit() as effect:
+            for idx in range(self.cfg.classifier_length):
+                if previous_situation[idx] != situation[idx] and effect[idx] == self.cfg.classifier_wildcard:
+                    effect[idx] = situation[idx]
+                    condition[idx] = previous_situation[idx]
 
 
     def average_fitnesses_from_other_cl(
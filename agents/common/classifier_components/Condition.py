@@ -5,7 +5,8 @@
 """
 
 from __future__ import annotations
-from typing import Callable, Union
+from bisect import insort
+from typing import Callable, List, Union
 
 from agents.common.Perception import Perception
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
@@ -16,8 +17,111 @@ class Condition(AbstractPerception):
     """
     Specifies the set of situations (perceptions) in which the classifier
     can be applied.
+    Match engines can watch a condition to be notified of every
+    modification made through __setitem__.
+    The indices of the specified attributes are computed on first use
+    and then maintained by __setitem__.
     """
 
+    __slots__ = ['_watchers', '_specified']
+
+    def __init__(
+            self,
+            observation,
+            wildcard='#'
+        ) -> None:
+        super().__init__(observation, wildcard)
+        self._watchers = ()
+        self._specified = None
+
+
+    def __setitem__(self, index, value) -> None:
+        old_value = self._items[index]
+        super().__setitem__(index, value)
+        specified = self._specified
+        if specified is not None:
+            was_specified = old_value != self.wildcard
+            if was_specified != (value != self.wildcard):
+                if index < 0:
+                    index += len(self._items)
+                if was_specified:
+                    specified.remove(index)
+                else:
+                    insort(specified, index)
+        for watcher in self._watchers:
+            watcher.condition_changed(self, index, old_value, value)
+
+
+    def _assign(self, items: List) -> None:
+        old_items = self._items
+        super()._assign(items)
+        self._specified = None
+        if self._watchers:
+            for index, (old_value, value) in enumerate(zip(old_items, self._items)):
+                if old_value != value:
+                    for watcher in self._watchers:
+                        watcher.condition_changed(self, index, old_value, value)
+
+
+    def clone(self) -> Condition:
+        """
+        Returns a copy sharing the immutable items, without the watchers.
+
+        Returns
+        -------
+        Condition
+        """
+        cloned = super().clone()
+        cloned._watchers = ()
+        cloned._specified = None if self._specified is None else self._specified[:]
+        return cloned
+
+
+    @property
+    def specified_indices(self) -> List[int]:
+        """
+        Returns, in increasing order, the indices of the items different
+        from the wildcard. The returned list must not be modified.
+
+        Returns
+        -------
+        List[int]
+        """
+        specified = self._specified
+        if specified is None:
+            specified = self._specified = [i for i, c in enumerate(self._items) if c != self.wildcard]
+        return specified
+
+
+    def add_watcher(
+            self,
+            watcher
+        ) -> None:
+        """
+        Registers an object whose condition_changed method is called
+        after each modification of the condition.
+
+        Parameters
+        ----------
+            watcher
+        """
+        if not any(w is watcher for w in self._watchers):
+            self._watchers = self._watchers + (watcher,)
+
+
+    def remove_watcher(
+            self,
+            watcher
+        ) -> None:
+        """
+        Unregisters a watcher of the condition.
+
+        Parameters
+        ----------
+            watcher
+        """
+        self._watchers = tuple(w for w in self._watchers if w is not watcher)
+
 
     @property
     def specificity(self) -> int:
@@ -28,7 +132,7 @@ class Condition(AbstractPerception):
         -------
         int
         """
-        return sum(1 for attr in self if attr != self.wildcard)
+        return len(self.specified_indices)
 
 
     @property
@@ -40,7 +144,7 @@ class Condition(AbstractPerception):
         -------
         int
         """
-        return sum(1 for attr in self if attr == self.wildcard)
+        return len(self._items) - len(self.specified_indices)
 
 
     def specialize_with_condition(
@@ -54,9 +158,10 @@ class Condition(AbstractPerception):
         ----------
             other: Condition
         """
-        for idx, new_el in enumerate(other):
-            if new_el != self.wildcard:
-                self[idx] = new_el
+        with self.edit() as items:
+            for idx, new_el in enumerate(other):
+                if new_el != self.wildcard:
+                    items[idx] = new_el
 
 
     def generalize(
@@ -84,10 +189,10 @@ class Condition(AbstractPerception):
         ----------
             func: Callable
         """
-        specific_ids = [i for i, c in enumerate(self) if c != self.wildcard]
+        specific_ids = self.specified_indices
         if len(specific_ids) > 0:
             ridx = func(specific_ids)
-            self.generalize(ridx)
+            self.generalize(int(ridx))
 
 
     def does_match(
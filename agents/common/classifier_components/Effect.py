@@ -5,8 +5,11 @@
 """
 
 from __future__ import annotations
+from typing import List, Optional, Tuple
 
+from agents.common.InterningStore import InterningStore
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.classifier_components.AbstractPerception import AbstractPerception
 
 
@@ -14,8 +17,69 @@ class Effect(AbstractPerception):
     """
     Anticipates the effects that the classifier 'believes'
     to be caused by the specified action.
+    The indices of the specified attributes and the values they anticipate
+    are compiled on first use, and compiled again after a modification.
     """
 
+    __slots__ = ['_anticipation']
+
+    def __init__(
+            self,
+            observation,
+            wildcard='#'
+        ) -> None:
+        super().__init__(observation, wildcard)
+        self._anticipation = None
+
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._anticipation = None
+
+
+    def _assign(self, items: List) -> None:
+        super()._assign(items)
+        self._anticipation = None
+
+
+    def clone(self) -> Effect:
+        cloned = super().clone()
+        cloned._anticipation = self._anticipation
+        return cloned
+
+
+    def __hash__(self) -> int:
+        # Equal effects have the same anticipation, whatever their representation
+        anticipation = self._anticipation
+        if anticipation is None:
+            anticipation = self.anticipation
+        store = InterningStore.current()
+        if store is not None:
+            return store.hash_of(anticipation)
+        return hash(anticipation)
+
+
+    @property
+    def anticipation(self) -> Tuple[Tuple[int, ...], tuple]:
+        """
+        Returns the indices of the specified attributes, in increasing order,
+        and the values anticipated at these indices.
+
+        Returns
+        -------
+        Tuple[Tuple[int, ...], tuple]
+        """
+        anticipation = self._anticipation
+        if anticipation is None:
+            wildcard = self.wildcard
+            specified = [(idx, item) for idx, item in enumerate(self._items) if item != wildcard]
+            anticipation = self._anticipation = InterningStore.canonical((
+                InterningStore.canonical(tuple(idx for idx, _ in specified)),
+                InterningStore.canonical(tuple(item for _, item in specified))
+            ))
+        return anticipation
+
+
     @property
     def specify_change(self) -> bool:
         """
@@ -26,13 +90,14 @@ class Effect(AbstractPerception):
         -------
         bool
         """
-        return any(True for e in self if e != self.wildcard)
+        return len(self.anticipation[0]) > 0
 
 
     def is_specializable(
             self, 
             p0: Perception, 
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if the effect part can be modified to anticipate
@@ -42,49 +107,55 @@ class Effect(AbstractPerception):
         ----------
             p0: Perception
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
         
         Returns
         -------
         bool
         """
-        for p0i, p1i, ei in zip(p0, p1, self):
-            if ei != self.wildcard:
-                if ei != p1i or p0i == p1i:
-                    return False
+        if transition is None:
+            transition = Transition(p0, p1)
+        changed = transition.changed
+        p1_items = transition.p1_items
+        indices, values = self.anticipation
+        for idx, value in zip(indices, values):
+            if not changed[idx] or p1_items[idx] != value:
+                return False
         return True
 
 
     def does_anticipate_correctly(
             self,
             p0: Perception,
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
-        Determines if the effect anticipates correctly changes from `p0` to `p1`.
+        Determines if the effect anticipates correctly changes from `p0` to `p1`,
+        that is if exactly the specified attributes changed, to the specified values.
 
         Parameters
         ----------
             p0: Perception
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
 
         Returns
         -------
         bool
         """
-        def item_anticipate_change(
-                item,
-                p0_item,
-                p1_item,
-                wildcard
-            ) -> bool:
-            if item == wildcard:
-                if p0_item != p1_item: return False
-            else:
-                if p0_item == p1_item: return False
-                if item != p1_item: return False
-            # All checks passed
-            return True
-        return all(item_anticipate_change(eitem, p0[idx], p1[idx], self.wildcard) for idx, eitem in enumerate(self))
+        if transition is None:
+            transition = Transition(p0, p1)
+        indices, values = self.anticipation
+        if transition.changed_indices != indices:
+            return False
+        p1_items = transition.p1_items
+        for idx, value in zip(indices, values):
+            if p1_items[idx] != value:
+                return False
+        return True
 
 
     def subsumes(
@@ -107,6 +178,18 @@ class Effect(AbstractPerception):
         return True
 
 
+    def signatures(self) -> tuple:
+        """
+        Returns the hashable keys under which the effect is indexed to look for subsumers.
+        The first signature of an effect is among the signatures of any effect subsuming it.
+
+        Returns
+        -------
+        tuple
+        """
+        return (self.anticipation, )
+
+
     def getEffectAttribute(
             self,
             perception: Perception,
@@ -4,21 +4,76 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from typing import List
+from typing import Optional, Tuple
 
 from agents.common.BaseConfiguration import BaseConfiguration
 from agents.common.Perception import Perception
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
-from agents.common.TypedList import TypedList
+from agents.common.SymbolAlphabet import render_symbol
+from agents.common.Transition import Transition
 from agents.common.classifier_components.Condition import Condition
 
 
-class PMark(TypedList):
+class PMark:
+    """
+    Keeps, for each attribute, the set of symbols perceived when the classifier
+    was marked. Each set is stored as a bitmask over the symbols given a bit
+    by the configuration, and no storage is allocated until the first marking.
+    """
+
+    __slots__ = ['cfg', '_masks']
 
     def __init__(self, cfg: BaseConfiguration) -> None:
         self.cfg = cfg
-        initial: List = [set() for _ in range(self.cfg.classifier_length)]
-        super().__init__((set,), *initial)
+        self._masks = None
+
+
+    def _p0_bits(self, transition: Transition) -> Tuple[int, ...]:
+        # Bits of the symbols of p0, 0 for those without a bit, encoded again
+        # for the transition whenever symbols were given a bit in between
+        symbol_bits = self.cfg.symbol_bits
+        size = len(symbol_bits)
+        if transition.p0_bits is None or transition.p0_bits_symbols != size:
+            bits = symbol_bits.bits
+            transition.p0_bits = tuple(bits.get(item, 0) for item in transition.p0_items)
+            transition.p0_bits_symbols = size
+        return transition.p0_bits
+
+
+    def _decode(self, mask: int) -> set:
+        registered = self.cfg.symbol_bits.symbols
+        symbols = set()
+        position = 0
+        while mask:
+            if mask & 1:
+                symbols.add(registered[position])
+            mask >>= 1
+            position += 1
+        return symbols
+
+
+    def __getitem__(self, index) -> set:
+        if self._masks is None:
+            return set()
+        return self._decode(self._masks[index])
+
+
+    def __iter__(self):
+        for index in range(self.cfg.classifier_length):
+            yield self[index]
+
+
+    def __len__(self) -> int:
+        return self.cfg.classifier_length
+
+
+    def __eq__(self, other) -> bool:
+        if self._masks is None or other._masks is None:
+            return not any(self._masks or ()) and not any(other._masks or ())
+        return self._masks == other._masks
+
+
+    __hash__ = None
 
 
     def is_marked(self) -> bool:
@@ -28,13 +83,34 @@ class PMark(TypedList):
         bool
             If mark is specified at any attribute
         """
-        return any(len(attrib) != 0 for attrib in self)
+        return self._masks is not None and any(self._masks)
+
+
+    def contains(
+            self,
+            index: int,
+            symbol
+        ) -> bool:
+        """
+        Checks whether the symbol is marked at the attribute index.
+
+        Parameters
+        ----------
+        index: int
+        symbol
+
+        Returns
+        ----------
+        bool
+        """
+        return self._masks is not None and bool(self._masks[index] & self.cfg.symbol_bits.bits.get(symbol, 0))
 
 
     def set_mark(
             self,
             perception: Perception,
-            is_ee: bool
+            is_ee: bool,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Specializes the mark in all attributes
@@ -45,11 +121,32 @@ class PMark(TypedList):
             Current situation
         is_ee: bool
             Indicates if the classifier is enhanceable
+        transition: Optional[Transition]
+            Transition starting from `perception`, if already computed
         """
         set_ee = is_ee
+        if self._masks is None:
+            self._masks = [0] * self.cfg.classifier_length
+        masks = self._masks
+        symbol_bits = self.cfg.symbol_bits
+        bits = symbol_bits.bits
+        if transition is not None:
+            p0_bits = self._p0_bits(transition)
+            if 0 in p0_bits:
+                # Symbols are given a bit in the order of the attributes, as below
+                for item in transition.p0_items:
+                    if item not in bits:
+                        symbol_bits.register(item)
+                p0_bits = self._p0_bits(transition)
+            for idx, bit in enumerate(p0_bits):
+                if not masks[idx] & bit:
+                    masks[idx] |= bit
+                    set_ee = False
+            return set_ee
         for idx, item in enumerate(perception):
-            if item not in self[idx]:
-                self[idx].add(perception[idx])
+            bit = bits.get(item) or symbol_bits.register(item)
+            if not masks[idx] & bit:
+                masks[idx] |= bit
                 set_ee = False
         return set_ee
 
@@ -72,15 +169,18 @@ class PMark(TypedList):
         """
         if not self.one_situation_in_mark():
             return False
+        masks = self._masks
+        bits = self.cfg.symbol_bits.bits
         for idx, item in enumerate(perception):
-            if item not in self[idx]:
+            if not masks[idx] & bits.get(item, 0):
                 return False
         return True
 
 
     def get_differences(
             self,
-            p0: Perception
+            p0: Perception,
+            transition: Optional[Transition] = None
         ) -> Condition:
         """
         Determines the strongest differences in between the mark
@@ -90,6 +190,8 @@ class PMark(TypedList):
         ----------
         p0: Perception
             Current situation
+        transition: Optional[Transition]
+            Transition starting from `p0`, if already computed
 
         Returns
         ----------
@@ -99,22 +201,24 @@ class PMark(TypedList):
             wildcard=self.cfg.classifier_wildcard,
             length=self.cfg.classifier_length
         )
-        # Count difference types
-        nr1, nr2 = 0, 0
-        for idx, item in enumerate(self):
-            if len(item) > 0 and p0[idx] not in item:
-                nr1 += 1
-            elif len(item) > 1:
-                nr2 += 1
-        if nr1 > 0:
-            possible_idx = [pi for pi, p in enumerate(p0) if
-                            p not in self[pi] and len(self[pi]) > 0]
+        if self._masks is None:
+            return diff
+        masks = self._masks
+        if transition is not None:
+            p0_bits = self._p0_bits(transition)
+        else:
+            bits = self.cfg.symbol_bits.bits
+            p0_bits = [bits.get(item, 0) for item in p0]
+        # Attributes whose mark does not contain the symbol of p0
+        possible_idx = [idx for idx, (mask, bit) in enumerate(zip(masks, p0_bits)) if mask and not mask & bit]
+        if possible_idx:
             rand_idx = RandomNumberGenerator.choice(possible_idx)
             diff[rand_idx] = p0[rand_idx]
-        elif nr2 > 0:
-            for idx, item in enumerate(self):
-                if len(item) > 1:
-                    diff[idx] = p0[idx]
+        elif any(mask & (mask - 1) for mask in masks):
+            with diff.edit() as items:
+                for idx, mask in enumerate(masks):
+                    if mask & (mask - 1):
+                        items[idx] = p0[idx]
         return diff
 
 
@@ -129,8 +233,8 @@ class PMark(TypedList):
         """
         if not self.is_marked():
             return False
-        for _, item in enumerate(self):
-            if len(item) > 1:
+        for mask in self._masks:
+            if mask & (mask - 1):
                 return False
         return True
 
@@ -138,11 +242,11 @@ class PMark(TypedList):
     def __repr__(self) -> str:
         def compact_set_str(s):
             if len(s) == 0:
-                return self.cfg.classifier_wildcard
+                return render_symbol(self.cfg.classifier_wildcard)
             elif len(s) == 1:
-                return next(iter(s))  # the only element in set
+                return render_symbol(next(iter(s)))  # the only element in set
             else:
-                return '{' + '.'.join(x for x in s) + '}'
+                return '{' + '.'.join(render_symbol(x) for x in s) + '}'
 
         if self.is_marked():
             return '.'.join(compact_set_str(x) for x in self)
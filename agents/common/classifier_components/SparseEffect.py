@@ -0,0 +1,144 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Tuple
+
+from agents.common.InterningStore import InterningStore
+from agents.common.classifier_components.Effect import Effect
+
+
+class SparseEffect(Effect):
+    """
+    Effect storing only its specified attributes, as their increasing indices
+    and the symbols anticipated there, along with its length.
+    Reading an attribute, comparing, hashing, subsuming and checking
+    anticipations then cost O(specified attributes) instead of O(length),
+    while the full items are only built for iterations and edit() blocks.
+    It can be used wherever an Effect is, and equals the Effect with the same items.
+    """
+
+    __slots__ = ['_length', '_indices', '_values']
+
+    def __init__(
+            self,
+            observation,
+            wildcard='#'
+        ) -> None:
+        self.wildcard = wildcard
+        self._anticipation = None
+        if isinstance(observation, SparseEffect) and observation.wildcard == wildcard:
+            self._length = observation._length
+            self._indices = observation._indices
+            self._values = observation._values
+            self._anticipation = observation._anticipation
+        else:
+            self._items = observation
+
+
+    @property
+    def _items(self) -> tuple:
+        items = [self.wildcard] * self._length
+        for idx, value in zip(self._indices, self._values):
+            items[idx] = value
+        return tuple(items)
+
+
+    @_items.setter
+    def _items(self, observation) -> None:
+        observation = tuple(observation)
+        wildcard = self.wildcard
+        specified = [(idx, item) for idx, item in enumerate(observation) if item != wildcard]
+        self._length = len(observation)
+        self._indices = InterningStore.canonical(tuple(idx for idx, _ in specified))
+        self._values = InterningStore.canonical(tuple(item for _, item in specified))
+        self._anticipation = None
+
+
+    def clone(self) -> SparseEffect:
+        cloned = object.__new__(type(self))
+        cloned.wildcard = self.wildcard
+        cloned._anticipation = self._anticipation
+        cloned._length = self._length
+        cloned._indices = self._indices
+        cloned._values = self._values
+        return cloned
+
+
+    @property
+    def anticipation(self) -> Tuple[Tuple[int, ...], tuple]:
+        anticipation = self._anticipation
+        if anticipation is None:
+            anticipation = self._anticipation = (self._indices, self._values)
+        return anticipation
+
+
+    def _position(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SparseEffect index out of range")
+        return index, bisect_left(self._indices, index)
+
+
+    def __len__(self) -> int:
+        return self._length
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._items[index]
+        index, position = self._position(index)
+        if position < len(self._indices) and self._indices[position] == index:
+            return self._values[position]
+        return self.wildcard
+
+
+    def __setitem__(self, index, value) -> None:
+        index, position = self._position(index)
+        indices = list(self._indices)
+        values = list(self._values)
+        if position < len(indices) and indices[position] == index:
+            if value == self.wildcard:
+                del indices[position]
+                del values[position]
+            else:
+                values[position] = value
+        elif value != self.wildcard:
+            indices.insert(position, index)
+            values.insert(position, value)
+        self._indices = InterningStore.canonical(tuple(indices))
+        self._values = InterningStore.canonical(tuple(values))
+        self._anticipation = None
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Effect):
+            return len(self) == len(other) and self.anticipation == other.anticipation
+        return self._items == other._items
+
+
+    def __hash__(self) -> int:
+        return hash(self.anticipation)
+
+
+    def subsumes(
+            self,
+            other: Effect
+        ) -> bool:
+        """
+        Determines if the effect subsumes another effect.
+
+        Parameters
+        ----------
+            other: Effect
+
+        Returns
+        -------
+        bool
+        """
+        return self.anticipation == other.anticipation
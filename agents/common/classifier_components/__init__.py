@@ -7,5 +7,6 @@
 from .AbstractPerception import AbstractPerception
 from .Condition import Condition
 from .Effect import Effect
+from .SparseEffect import SparseEffect
 from .PMark import PMark
 from .BaseClassifier import BaseClassifier
\ No newline at end of file
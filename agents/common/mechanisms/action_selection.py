@@ -4,8 +4,7 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from itertools import groupby
-
+from agents.common.ActionAggregates import ActionAggregates
 from agents.common.BaseClassifiersList import BaseClassifiersList
 from agents.common.BaseConfiguration import BaseConfiguration
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
@@ -81,18 +80,13 @@ def choose_latest_action(
     -------
     BaseClassifier
     """
-    last_executed_cls = None
-    number_of_cls_per_action = {i: 0 for i in range(cfg.number_of_possible_actions)}
     if len(cll) > 0:
-        last_executed_cls = min(cll, key=lambda cl: cl.talp)
+        aggregates = ActionAggregates(cll)
         # If there are some actions with no classifiers - select them
-        cll.sort(key=lambda cl: cl.action)
-        for _action, _clss in groupby(cll, lambda cl: cl.action):
-            number_of_cls_per_action[_action] = sum([cl.num for cl in _clss])
-        for action, nCls in number_of_cls_per_action.items():
-            if nCls == 0:
+        for action in range(cfg.number_of_possible_actions):
+            if action not in aggregates.numerosity:
                 return BaseClassifier(action=action, cfg=cfg)
-        return last_executed_cls
+        return aggregates.latest
     return choose_random_classifiers(cll, cfg)
 
 
@@ -115,20 +109,12 @@ def choose_action_from_knowledge_array(
     -------
     BaseClassifier
     """
-    knowledge_array = {i: 0.0 for i in range(cfg.number_of_possible_actions)}
     if len(cll) > 0:
-        #Sort and build knowledge array
-        cll.sort(key=lambda cl: cl.action)
-        for _action, _clss in groupby(cll, lambda cl: cl.action):
-            _classifiers = [cl for cl in _clss]
-            agg_q = sum(cl.q * cl.num for cl in _classifiers)
-            agg_num = sum(cl.num for cl in _classifiers)
-            knowledge_array[_action] = agg_q / float(agg_num)
-        by_quality = sorted(knowledge_array.items(), key=lambda el: el[1])
-        #Find action and retrun one related classifier
-        action = by_quality[0][0]
-        classifiers_that_match_action = [cl for cl in cll if cl.action == action]
-        if len(classifiers_that_match_action) > 0:
+        aggregates = ActionAggregates(cll)
+        #Find the first action of least knowledge and retrun one related classifier
+        action = min(range(cfg.number_of_possible_actions), key=aggregates.knowledge)
+        classifiers_that_match_action = aggregates.classifiers.get(action)
+        if classifiers_that_match_action:
             return RandomNumberGenerator.choice(classifiers_that_match_action)
         else:
             return BaseClassifier(action=action, cfg=cfg)
@@ -177,5 +163,5 @@ def choose_fittest_classifier(
     BaseClassifier
     """
     if len(cll) > 0:
-        return max(cll, key=lambda cl: cl.fitness)
+        return cll.fittest()
     return choose_random_classifiers(cll, cfg)
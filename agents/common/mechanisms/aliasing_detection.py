@@ -29,9 +29,12 @@ def is_state_aliased(
     bool
     """
     if mark.one_situation_in_mark():
-        situation = Condition(condition)
+        # The situation is the condition with wildcards replaced by the marked symbols
         for idx, item in enumerate(condition):
             if item == condition.wildcard:
-                situation[idx] = ''.join(str(s) for s in mark[idx])
-        return situation.does_match(p0)
+                if not mark.contains(idx, p0[idx]):
+                    return False
+            elif item != p0[idx]:
+                return False
+        return True
     return False
\ No newline at end of file
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 from agents.common.BaseConfiguration import BaseConfiguration
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
 from agents.common.classifier_components.Condition import Condition
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
@@ -55,7 +56,8 @@ def expected_case(
         cl: BaseClassifier,
         p0: Perception,
         time: int,
-        p1: Perception=None
+        p1: Perception=None,
+        transition: Optional[Transition]=None
     ) -> Optional[BaseClassifier]:
     """
     Controls the expected case of a classifier with the help of 
@@ -67,12 +69,13 @@ def expected_case(
         p0: Perception
         time: int
         p1: Perception
+        transition: Optional[Transition]
 
     Returns
     ----------
     BaseClassifier
     """
-    diff = cl.mark.get_differences(p0)
+    diff = cl.mark.get_differences(p0, transition)
     if diff.specificity == 0:
         cl.increase_quality()
         return None
@@ -128,7 +131,8 @@ def unexpected_case(
         cl: BaseClassifier,
         p0: Perception,
         p1: Perception,
-        time: int
+        time: int,
+        transition: Optional[Transition]=None
     ) -> Optional[BaseClassifier]:
     """
     Controls the unexpected case of the classifier.
@@ -139,14 +143,15 @@ def unexpected_case(
         p0: Perception
         p1: Perception
         time: int
+        transition: Optional[Transition]
 
     Returns
     ----------
     BaseClassifier
     """
     cl.decrease_quality()
-    cl.set_mark(p0)
-    if not cl.is_specializable(p0, p1):
+    cl.set_mark(p0, transition)
+    if not cl.is_specializable(p0, p1, transition):
         return None
     child = cl.copy(time=time, perception=p1)
     child.specialize(p0, p1)
@@ -175,7 +180,7 @@ def add_classifier(
     old_cl = None
     equal_cl = None
     # Look if there is a classifier that subsumes the insertion candidate
-    for cl in population:
+    for cl in population.subsumption_candidates(child):
         if does_subsume(cl, child):
             if old_cl is None or cl.is_more_general(old_cl):
                 old_cl = cl
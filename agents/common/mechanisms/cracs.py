@@ -0,0 +1,102 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from agents.common.BaseClassifiersList import BaseClassifiersList
+from agents.common.SubsumptionIndex import SubsumptionIndex
+from agents.common.classifier_components.BaseClassifier import BaseClassifier
+
+
+def _find_bucket_subsumers(
+        buckets: List[Tuple[List[BaseClassifier], List[BaseClassifier]]]
+    ) -> Tuple[List[List[Optional[int]]], int]:
+    """
+    Looks, for each classifier of each bucket, for the first candidate
+    subsuming it. Candidates more specific than the classifier cannot
+    subsume it and are skipped without testing.
+    Runs in worker processes, so subsumers are returned as candidate indexes.
+
+    Parameters
+    ----------
+        buckets: List[Tuple[List[BaseClassifier], List[BaseClassifier]]]
+            Classifiers sharing a bucket and the candidates of the bucket, in population order
+
+    Returns
+    -------
+    Tuple[List[List[Optional[int]]], int]
+        Candidate indexes of the subsumers and number of candidates pruned by generality
+    """
+    results = []
+    pruned = 0
+    for classifiers, candidates in buckets:
+        specificities = [other.condition.specificity for other in candidates]
+        subsumers = []
+        for cl in classifiers:
+            specificity = cl.condition.specificity
+            subsumer = None
+            for idx, other in enumerate(candidates):
+                if specificities[idx] > specificity:
+                    pruned += 1
+                    continue
+                if cl != other and other.subsumes(cl):
+                    subsumer = idx
+                    break
+            subsumers.append(subsumer)
+        results.append(subsumers)
+    return results, pruned
+
+
+def find_subsumers(
+        population: BaseClassifiersList,
+        processes: int = 0
+    ) -> Tuple[Dict[int, BaseClassifier], Dict[str, int]]:
+    """
+    Finds, for each classifier of the population, the first classifier in
+    population order that subsumes it, as done by the all-pairs search of CRACS.
+    Classifiers are bucketed by action, behavioral sequence and effect, so that
+    subsumption is only tested inside buckets. Buckets can be dispatched to a pool
+    of processes, in which case the classifiers (and their configuration) must be picklable.
+
+    Parameters
+    ----------
+        population: BaseClassifiersList
+        processes: int
+            Number of worker processes, buckets are processed in place if lower than 2
+
+    Returns
+    -------
+    Tuple[Dict[int, BaseClassifier], Dict[str, int]]
+        Subsumers by classifier id and number of candidates pruned per rule
+    """
+    index = SubsumptionIndex()
+    index.rebuild(population)
+    grouped = {}
+    for cl in population:
+        grouped.setdefault(index.lookup_key(cl), []).append(cl)
+    buckets = [(classifiers, list(index.candidates(classifiers[0]))) for classifiers in grouped.values()]
+    population_size = len(population)
+    report = {
+        'bucket': sum(len(classifiers) * (population_size - len(candidates)) for classifiers, candidates in buckets),
+        'generality': 0
+    }
+    if processes > 1 and len(buckets) > 1:
+        chunks = [buckets[i::processes] for i in range(processes)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunk_results = list(executor.map(_find_bucket_subsumers, chunks))
+        results = [None] * len(buckets)
+        for i, (chunk_subsumers, pruned) in enumerate(chunk_results):
+            results[i::processes] = chunk_subsumers
+            report['generality'] += pruned
+    else:
+        results, report['generality'] = _find_bucket_subsumers(buckets)
+    subsumers = {}
+    for (classifiers, candidates), indexes in zip(buckets, results):
+        for cl, idx in zip(classifiers, indexes):
+            if idx is not None:
+                subsumers[id(cl)] = candidates[idx]
+    return subsumers, report
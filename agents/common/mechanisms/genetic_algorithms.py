@@ -4,10 +4,13 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
+
+import numpy as np
 
 from agents.common.BaseClassifiersList import BaseClassifiersList
 from agents.common.BaseConfiguration import BaseConfiguration
+from agents.common.LearningScheduler import LearningScheduler
 from agents.common.Perception import Perception
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
@@ -37,8 +40,12 @@ def should_apply(
     if action_set is None or not action_set:
         return False
 
-    overall_time = sum(cl.tga * cl.num for cl in action_set)
-    overall_num = sum(cl.num for cl in action_set)
+    overall_time = 0
+    overall_num = 0
+    for cl in action_set:
+        num = cl.num
+        overall_time += cl.tga * num
+        overall_num += num
 
     if overall_num == 0:
         return False
@@ -100,6 +107,34 @@ def roulette_wheel_selection(
     return parent1, parent2
 
 
+def vectorized_roulette_wheel_selection(
+        population: BaseClassifiersList,
+        fitnessfunc: Callable
+    ) -> tuple:
+    """
+    Selects two objects from population according to roulette-wheel
+    selection, searching both picks in the cumulative sums of the fitnesses.
+    The picks are drawn as in roulette_wheel_selection, which however
+    merges equal classifiers: they are weighted separately here.
+
+    Parameters
+    ----------
+        population: BaseClassifiersList
+        fitnessfunc: Callable
+
+    Returns
+    -------
+    tuple
+    """
+    classifiers = list(population)
+    fitnesses = [fitnessfunc(cl) for cl in classifiers]
+    cumulative = np.cumsum(fitnesses)
+    picks = RandomNumberGenerator.uniform(0, sum(fitnesses), 2)
+    parent1, parent2 = np.searchsorted(cumulative, picks, side='right').tolist()
+    last = len(classifiers) - 1
+    return classifiers[min(parent1, last)], classifiers[min(parent2, last)]
+
+
 def mutation(
         cl1: BaseClassifier,
         cl2: BaseClassifier,
@@ -116,11 +151,12 @@ def mutation(
         cl2: BaseClassifier
         mu: float
     """
-    for idx in range(len(cl1.condition)):
-        if cl1.condition[idx] != cl1.cfg.classifier_wildcard and RandomNumberGenerator.random() < mu:
-            cl1.condition.generalize(idx)
-        if cl2.condition[idx] != cl2.cfg.classifier_wildcard and RandomNumberGenerator.random() < mu:
-            cl2.condition.generalize(idx)
+    with cl1.condition.edit() as condition1, cl2.condition.edit() as condition2:
+        for idx in range(len(condition1)):
+            if condition1[idx] != cl1.cfg.classifier_wildcard and RandomNumberGenerator.random() < mu:
+                condition1[idx] = cl1.condition.wildcard
+            if condition2[idx] != cl2.cfg.classifier_wildcard and RandomNumberGenerator.random() < mu:
+                condition2[idx] = cl2.condition.wildcard
 
 
 def two_point_crossover(
@@ -144,9 +180,9 @@ def two_point_crossover(
     chromosome2 = donor.condition[left:right]
 
     # Flip them
-    for idx, el in enumerate(range(left, right)):
-        parent.condition[el] = chromosome2[idx]
-        donor.condition[el] = chromosome1[idx]
+    with parent.condition.edit() as condition1, donor.condition.edit() as condition2:
+        condition1[left:right] = chromosome2
+        condition2[left:right] = chromosome1
 
 
 def delete_classifiers(
@@ -185,6 +221,62 @@ def delete_classifiers(
                 lst.safe_remove(cl_del)
 
 
+def vectorized_delete_classifiers(
+        population: BaseClassifiersList,
+        match_set: BaseClassifiersList,
+        action_set: BaseClassifiersList,
+        insize: int, 
+        theta_as: int,
+        replay: bool = False
+    ) -> None:
+    """
+    Makes room for new classifiers, running the deletion tournaments of
+    delete_classifiers over the numerosities without expanding them.
+    A classifier of numerosity n enters a tournament with probability
+    1 - 0.7^n, as when each of its micro-classifiers enters it with
+    probability 0.3, with one draw per classifier.
+    With `replay`, one draw per micro-classifier is made instead,
+    so that the random draws of delete_classifiers are reproduced.
+
+    Parameters
+    ----------
+        population: BaseClassifiersList
+        match_set: BaseClassifiersList
+        action_set: BaseClassifiersList
+        insize: int
+        theta_as: int
+        replay: bool = False
+    """
+    while True:
+        classifiers = list(action_set)
+        nums = np.array([cl.num for cl in classifiers], dtype=np.int64)
+        cumulative = np.cumsum(nums)
+        total = int(cumulative[-1]) if len(classifiers) > 0 else 0
+        if insize + total <= theta_as:
+            break
+        # We must delete at least one
+        first = RandomNumberGenerator.integers(total)
+        cl_del = classifiers[int(np.searchsorted(cumulative, first, side='right'))]
+        if replay:
+            micro = np.flatnonzero(RandomNumberGenerator.random(total) < .3)
+            # Consecutive micro-classifiers of a classifier compare alike to the candidate
+            candidates = np.unique(np.searchsorted(cumulative, micro, side='right'))
+        else:
+            candidates = np.flatnonzero(RandomNumberGenerator.random(len(classifiers)) < 1. - .7 ** nums)
+        for idx in candidates.tolist():
+            cl = classifiers[idx]
+            if _is_preferred_to_delete(cl_del, cl):
+                cl_del = cl
+        if cl_del.num > 1:
+            cl_del.num -= 1
+        else:
+            # Removes classifier from population, match set
+            # and current list
+            lists = [x for x in [population, match_set, action_set] if x]
+            for lst in lists:
+                lst.safe_remove(cl_del)
+
+
 def _is_preferred_to_delete(
         cl_del: BaseClassifier,
         cl: BaseClassifier
@@ -234,7 +326,7 @@ def add_classifier(
     old_cl = None
     equal_cl = None
     # Look if there is a classifier that subsumes the insertion candidate
-    for cl in population:
+    for cl in population.subsumption_candidates(child):
         if does_subsume(cl, child):
             if old_cl is None or cl.is_more_general(old_cl):
                 old_cl = cl
@@ -256,7 +348,7 @@ def add_classifier(
             old_cl.num += child.num
 
 
-def apply(
+def generate_offspring(
         cls_ClassifiersList: BaseClassifiersList,
         mutate_function: Callable,
         crossover_function: Callable,
@@ -269,7 +361,8 @@ def apply(
         cfg: BaseConfiguration
     ) -> None:
     """
-    Apply the whole genetic generalization mechanism to the action set.
+    Selects two parents in the action set, inserts their offspring
+    and deletes classifiers to make room for them.
 
     Parameters
     ----------
@@ -284,28 +377,30 @@ def apply(
         time: int
         cfg: BaseConfiguration
     """
-
-    if should_apply(action_set, time, cfg.theta_ga):
-        set_timestamps(action_set, time)
-        # Select parents
-        parent1, parent2 = roulette_wheel_selection(
-            action_set, 
-            lambda cl: pow(cl.q, 3)
-        )
-        child1 = parent1.copy(time=time, perception=p1)
-        child2 = parent2.copy(time=time, perception=p1)
-        # Execute mutation
-        mutate_function(child1, child2, cfg.mu)
-        # Execute cross-over
-        if RandomNumberGenerator.random() < cfg.chi:
-            if child1.effect == child2.effect:
-                crossover_function(child1, child2)
-                # Update quality and reward
-                child1.average_fitnesses_from_other_cl(child2)
-        child1.q /= 2
-        child2.q /= 2
-        # We are interested only in classifiers with specialized condition
-        children = {cl for cl in [child1, child2] if cl.condition.specificity > 0}
+    # Select parents
+    if cfg.ga_selection is None:
+        selection = roulette_wheel_selection
+    else:
+        selection = vectorized_roulette_wheel_selection
+    parent1, parent2 = selection(
+        action_set, 
+        lambda cl: pow(cl.q, 3)
+    )
+    child1 = parent1.copy(time=time, perception=p1)
+    child2 = parent2.copy(time=time, perception=p1)
+    # Execute mutation
+    mutate_function(child1, child2, cfg.mu)
+    # Execute cross-over
+    if RandomNumberGenerator.random() < cfg.chi:
+        if child1.effect == child2.effect:
+            crossover_function(child1, child2)
+            # Update quality and reward
+            child1.average_fitnesses_from_other_cl(child2)
+    child1.q /= 2
+    child2.q /= 2
+    # We are interested only in classifiers with specialized condition
+    children = {cl for cl in [child1, child2] if cl.condition.specificity > 0}
+    if cfg.ga_selection is None:
         delete_classifiers(
             population,
             match_set,
@@ -313,13 +408,84 @@ def apply(
             len(children),
             cfg.theta_as
         )
-        new_list = cls_ClassifiersList()
-        # check for subsumers / similar classifiers
-        for child in children:
-            add_classifier(
-                child,
-                action_set,
-                new_list
-            )
-        # Merge classifiers from new_list into self and population
-        cls_ClassifiersList.merge_newly_built_classifiers(new_list, population, match_set, action_set, p0, p1)
\ No newline at end of file
+    else:
+        vectorized_delete_classifiers(
+            population,
+            match_set,
+            action_set,
+            len(children),
+            cfg.theta_as,
+            cfg.ga_selection == 'numpy_replay'
+        )
+    new_list = cls_ClassifiersList()
+    # check for subsumers / similar classifiers
+    for child in children:
+        add_classifier(
+            child,
+            action_set,
+            new_list
+        )
+    # Merge classifiers from new_list into self and population
+    cls_ClassifiersList.merge_newly_built_classifiers(new_list, population, match_set, action_set, p0, p1)
+
+
+def _deferred_offspring(
+        cls_ClassifiersList: BaseClassifiersList,
+        mutate_function: Callable,
+        crossover_function: Callable,
+        population: BaseClassifiersList,
+        match_set: BaseClassifiersList,
+        action_set: BaseClassifiersList,
+        p0: Perception,
+        p1: Perception,
+        time: int,
+        cfg: BaseConfiguration
+    ) -> None:
+    # Classifiers deleted since the action set was formed are not selected
+    action_set = cls_ClassifiersList(*(cl for cl in action_set if cl in population))
+    if action_set:
+        generate_offspring(cls_ClassifiersList, mutate_function, crossover_function,
+            population, match_set, action_set, p0, p1, time, cfg)
+
+
+def apply(
+        cls_ClassifiersList: BaseClassifiersList,
+        mutate_function: Callable,
+        crossover_function: Callable,
+        population: BaseClassifiersList,
+        match_set: BaseClassifiersList,
+        action_set: BaseClassifiersList,
+        p0: Perception,
+        p1: Perception,
+        time: int,
+        cfg: BaseConfiguration,
+        scheduler: Optional[LearningScheduler] = None
+    ) -> None:
+    """
+    Apply the whole genetic generalization mechanism to the action set.
+    With a learning scheduler, the offspring are generated when the scheduler
+    runs the deferred operation, from a copy of the action set.
+
+    Parameters
+    ----------
+        cls_ClassifiersList: BaseClassifiersList
+        mutate_function: Callable
+        crossover_function: Callable
+        population: BaseClassifiersList
+        match_set: BaseClassifiersList
+        action_set: BaseClassifiersList
+        p0: Perception
+        p1: Perception
+        time: int
+        cfg: BaseConfiguration
+        scheduler: Optional[LearningScheduler]
+    """
+
+    if should_apply(action_set, time, cfg.theta_ga):
+        set_timestamps(action_set, time)
+        if scheduler is not None:
+            scheduler.defer('ga', _deferred_offspring, cls_ClassifiersList, mutate_function, crossover_function,
+                population, cls_ClassifiersList(), cls_ClassifiersList(*action_set), p0, p1, time, cfg)
+        else:
+            generate_offspring(cls_ClassifiersList, mutate_function, crossover_function,
+                population, match_set, action_set, p0, p1, time, cfg)
\ No newline at end of file
@@ -4,6 +4,8 @@
     file, You can obtain one at http://mozilla.org/MPL/2.0/.
 """
 
+from typing import Iterable
+
 
 def update_classifier_q_learning(
         cl, 
@@ -26,3 +28,30 @@ def update_classifier_q_learning(
     """
     cl.r += beta_rl * (step_reward + gamma * max_fitness - cl.r)
     cl.ir += beta_rl * (step_reward - cl.ir)
+
+
+def update_q_learning_batch(
+        classifiers: Iterable,
+        step_reward: int,
+        max_fitness: float,
+        beta_rl: float,
+        gamma: float
+    ) -> None:
+    """
+    Applies Q-Learning to a set of classifiers, as `update_classifier_q_learning`
+    does to each of them in turn. The target of the updates is computed once
+    for the set, and the operations are kept in the same order, so that results
+    are identical.
+
+    Parameters
+    ----------
+        classifiers: Iterable
+        step_reward: int
+        max_fitness: float
+        beta_rl: float
+        gamma: float
+    """
+    target = step_reward + gamma * max_fitness
+    for cl in classifiers:
+        cl.r += beta_rl * (target - cl.r)
+        cl.ir += beta_rl * (step_reward - cl.ir)
@@ -6,6 +6,7 @@
 
 from agents.common.Perception import Perception
 from agents.common.Agent import Agent, TrialMetrics
+from agents.common.Transition import Transition
 from agents.common.mechanisms.action_selection import choose_classifier
 
 from agents.pepacs.PEPACSConfiguration import PEPACSConfiguration
@@ -56,7 +57,8 @@ class PEPACS(Agent):
                     action_classifier.action,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state)
                 )
                 PEPACSClassifiersList.apply_reinforcement_learning(
                     action_set,
@@ -71,7 +73,8 @@ class PEPACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
             # Choose classifier
@@ -96,7 +99,8 @@ class PEPACS(Agent):
                     action_classifier.action,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    Transition(prev_state, state)
                 )
                 PEPACSClassifiersList.apply_reinforcement_learning(
                     action_set, 
@@ -111,9 +115,12 @@ class PEPACS(Agent):
                     prev_state,
                     state,
                     time + steps,
-                    self.cfg
+                    self.cfg,
+                    self.scheduler
                 )
 
+            if self.scheduler is not None:
+                self.scheduler.end_step()
             steps += 1
         return TrialMetrics(steps, total_reward)
 
@@ -11,9 +11,11 @@ from agents.common.RandomNumberGenerator import RandomNumberGenerator
 import agents.common.mechanisms.alp as alp_common
 import agents.common.mechanisms.genetic_algorithms as ga
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.BaseClassifiersList import BaseClassifiersList
+from agents.common.LearningScheduler import LearningScheduler
 from agents.common.classifier_components.BaseClassifier import BaseClassifier
-from agents.common.mechanisms.reinforcement_learning import update_classifier_q_learning
+from agents.common.mechanisms.reinforcement_learning import update_q_learning_batch
 
 import agents.pepacs.mechanisms.alp as alp_pepacs
 from agents.pepacs.PEPACSConfiguration import PEPACSConfiguration
@@ -38,7 +40,8 @@ class PEPACSClassifiersList(BaseClassifiersList):
             action: int,
             p1: Perception,
             time: int,
-            cfg: PEPACSConfiguration
+            cfg: PEPACSConfiguration,
+            transition: Optional[Transition] = None
         ) -> None:
         """
         The Anticipatory Learning Process. Handles insertion, update and deletion
@@ -54,7 +57,11 @@ class PEPACSClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: PEPACSConfiguration
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, computed here if not given
         """
+        if transition is None:
+            transition = Transition(p0, p1)
         new_list = PEPACSClassifiersList()
         new_cl: Optional[PEPACSClassifier] = None
         was_expected_case = False
@@ -68,11 +75,11 @@ class PEPACSClassifiersList(BaseClassifiersList):
             cl.increase_experience()
             cl.set_alp_timestamp(time)
 
-            if cl.does_anticipate_correctly(p0, p1):
-                new_cl = alp_pepacs.expected_case(cl, p0, p1, time)
+            if cl.does_anticipate_correctly(p0, p1, transition=transition):
+                new_cl = alp_pepacs.expected_case(cl, p0, p1, time, transition)
                 was_expected_case = True
             else:
-                new_cl = alp_common.unexpected_case(cl, p0, p1, time)
+                new_cl = alp_common.unexpected_case(cl, p0, p1, time, transition)
 
             if cl.is_inadequate():
                 # Removes classifier from population, match set
@@ -116,8 +123,7 @@ class PEPACSClassifiersList(BaseClassifiersList):
             max_fitness: float
             cfg: PEPACSConfiguration
         """
-        for cl in action_set:
-            update_classifier_q_learning(cl, reward, max_fitness, cfg.beta_rl, cfg.gamma)
+        update_q_learning_batch(action_set, reward, max_fitness, cfg.beta_rl, cfg.gamma)
 
 
     @staticmethod
@@ -128,7 +134,8 @@ class PEPACSClassifiersList(BaseClassifiersList):
             p0: Perception,
             p1: Perception,
             time: int,
-            cfg: PEPACSConfiguration
+            cfg: PEPACSConfiguration,
+            scheduler: Optional[LearningScheduler] = None
         ) -> None:
         """
         The Genetic Generalization mechanism. Handles insertion, update and deletion
@@ -143,6 +150,8 @@ class PEPACSClassifiersList(BaseClassifiersList):
             p1: Perception
             time: int
             cfg: PEPACSConfiguration
+            scheduler: Optional[LearningScheduler]
+                Scheduler deferring the generation of offspring, if any
         """
         ga.apply(
             PEPACSClassifiersList,
@@ -154,5 +163,6 @@ class PEPACSClassifiersList(BaseClassifiersList):
             p0,
             p1,
             time,
-            cfg
+            cfg,
+            scheduler
         )
\ No newline at end of file
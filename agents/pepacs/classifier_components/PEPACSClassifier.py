@@ -13,11 +13,14 @@ from agents.common.classifier_components.BaseClassifier import BaseClassifier
 
 from agents.pepacs.PEPACSConfiguration import PEPACSConfiguration
 from agents.pepacs.classifier_components.PEPEffect import PEPEffect
+from agents.pepacs.classifier_components.SparsePEPEffect import SparsePEPEffect
 from agents.pepacs.classifier_components.ProbabilityEnhancedAttribute import ProbabilityEnhancedAttribute
 
 
 class PEPACSClassifier(BaseClassifier):
 
+    __slots__ = []
+
     def __init__(
             self,
             condition: Union[Condition, str, None] = None,
@@ -56,7 +59,7 @@ class PEPACSClassifier(BaseClassifier):
             if initial:
                 return cls(initial, wildcard=wildcard)
             return cls.empty(wildcard=wildcard, length=length)
-        self.effect = _build_perception_string(PEPEffect, effect)
+        self.effect = _build_perception_string(SparsePEPEffect if self.cfg.sparse_effects else PEPEffect, effect)
 
 
     def copy(
@@ -81,7 +84,7 @@ class PEPACSClassifier(BaseClassifier):
         new_cls = PEPACSClassifier(
             condition=Condition(self.condition, self.cfg.classifier_wildcard),
             action=self.action,
-            effect=PEPEffect(self.effect, self.cfg.classifier_wildcard),
+            effect=type(self.effect)(self.effect, self.cfg.classifier_wildcard),
             quality=self.q,
             reward=self.r,
             immediate_reward=self.ir,
@@ -163,9 +166,9 @@ class PEPACSClassifier(BaseClassifier):
             tga = time,
             cfg = self.cfg
         )
-        result.condition = Condition(self.condition)
+        result.condition = Condition(self.condition, self.cfg.classifier_wildcard)
         result.condition.specialize_with_condition(other_classifier.condition)
-        result.effect = PEPEffect.enhanced_effect(
+        result.effect = type(self.effect).enhanced_effect(
             self.effect, 
             other_classifier.effect,
             perception)
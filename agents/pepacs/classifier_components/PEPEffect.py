@@ -5,8 +5,10 @@
 """
 
 from __future__ import annotations
+from typing import Optional
 
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.classifier_components.Effect import Effect
 
 from agents.pepacs.classifier_components.ProbabilityEnhancedAttribute import ProbabilityEnhancedAttribute
@@ -18,6 +20,8 @@ class PEPEffect(Effect):
     to be caused by the specified action.
     """
 
+    __slots__ = []
+
     def __init__(
             self,
             observation,
@@ -51,7 +55,8 @@ class PEPEffect(Effect):
     def is_specializable(
             self,
             p0: Perception,
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if the effect part can be modified to anticipate
@@ -61,6 +66,8 @@ class PEPEffect(Effect):
         ----------
             p0: Perception
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
 
         Returns
         -------
@@ -68,13 +75,14 @@ class PEPEffect(Effect):
         """
         if self.is_enhanced():
             return True
-        return super().is_specializable(p0, p1)
+        return super().is_specializable(p0, p1, transition)
 
 
     def does_anticipate_correctly(
             self,
             p0: Perception,
-            p1: Perception
+            p1: Perception,
+            transition: Optional[Transition] = None
         ) -> bool:
         """
         Determines if the effect list anticipates correctly changes from `p0` to `p1`.
@@ -83,11 +91,25 @@ class PEPEffect(Effect):
         ----------
             p0: Perception
             p1: Perception
+            transition: Optional[Transition]
+                Transition from `p0` to `p1`, if already computed
 
         Returns
         -------
         bool
         """
+        if not self.is_enhanced():
+            return super().does_anticipate_correctly(p0, p1, transition)
+        if transition is not None:
+            wildcard = self.wildcard
+            for ei, changed, p1i in zip(self._items, transition.changed, transition.p1_items):
+                if isinstance(ei, ProbabilityEnhancedAttribute):
+                    if not ei.does_contain(p1i): return False
+                elif ei == wildcard:
+                    if changed: return False
+                elif not changed or ei != p1i:
+                    return False
+            return True
         def item_anticipate_change(item, p0_item, p1_item, wildcard) -> bool:
             if not isinstance(item, ProbabilityEnhancedAttribute):
                 if item == wildcard:
@@ -130,8 +152,20 @@ class PEPEffect(Effect):
                 else:
                     if si != oi: return False
         return True
-    
-    
+
+
+    def signatures(self) -> tuple:
+        """
+        Returns the hashable keys under which the effect is indexed to look for subsumers.
+        Enhanced attributes subsume by containment, so all effects share the same key.
+
+        Returns
+        -------
+        tuple
+        """
+        return (None, )
+
+
     def getEffectAttribute(
             self,
             perception: Perception,
@@ -175,7 +209,8 @@ class PEPEffect(Effect):
         -------
         bool
         """
-        return any(isinstance(elem, ProbabilityEnhancedAttribute) for elem in self)
+        # Enhanced attributes are never wildcards
+        return any(isinstance(elem, ProbabilityEnhancedAttribute) for elem in self.anticipation[1])
 
 
     def update_enhanced_effect_probs(
@@ -218,7 +253,7 @@ class PEPEffect(Effect):
         -------
         BEACSClassifier
         """
-        result = cls(observation=effect1)
+        result = cls(observation=effect1, wildcard=effect1.wildcard)
         wildcard = effect1.wildcard
         for i, attr2 in enumerate(effect2):
             attr1 = effect1[i]
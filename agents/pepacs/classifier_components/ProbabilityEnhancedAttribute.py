@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from agents.common.SymbolAlphabet import render_symbol
+
 
 class ProbabilityEnhancedAttribute(dict):
     """
@@ -14,7 +16,7 @@ class ProbabilityEnhancedAttribute(dict):
 
     def __init__(self, attr):
         super().__init__()
-        if isinstance(attr, str):
+        if isinstance(attr, (str, int)):
             self[attr] = 1.0
         if isinstance(attr, dict):
             for symbol in attr:
@@ -234,5 +236,5 @@ class ProbabilityEnhancedAttribute(dict):
 
     def __str__(self):
         if len(self) == 1:
-            return str(next(iter(self)))
-        return "{" + ", ".join( "{}:{:.2f}%".format(sym[0], sym[1] * 100) for sym in self.sorted_items()) + "}"
\ No newline at end of file
+            return render_symbol(next(iter(self)))
+        return "{" + ", ".join( "{}:{:.2f}%".format(render_symbol(sym[0]), sym[1] * 100) for sym in self.sorted_items()) + "}"
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+    This Source Code Form is subject to the terms of the Mozilla Public
+    License, v. 2.0. If a copy of the MPL was not distributed with this
+    file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+
+from agents.common.classifier_components.SparseEffect import SparseEffect
+
+from agents.pepacs.classifier_components.PEPEffect import PEPEffect
+
+
+class SparsePEPEffect(PEPEffect, SparseEffect):
+    """
+    PEPEffect storing only its specified attributes, probability-enhanced
+    or not, as a SparseEffect does. Enhanced attributes keep the checks of
+    PEPEffect, which fall back on the sparse ones otherwise.
+    """
+
+    __slots__ = []
@@ -6,4 +6,5 @@
 
 from .ProbabilityEnhancedAttribute import ProbabilityEnhancedAttribute
 from .PEPEffect import PEPEffect
+from .SparsePEPEffect import SparsePEPEffect
 from .PEPACSClassifier import PEPACSClassifier
\ No newline at end of file
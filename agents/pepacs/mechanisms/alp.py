@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 import agents.common.mechanisms.aliasing_detection as aliasing_detection
 import agents.common.mechanisms.alp as alp_common
 from agents.common.Perception import Perception
+from agents.common.Transition import Transition
 from agents.common.RandomNumberGenerator import RandomNumberGenerator
 
 from agents.pepacs.classifier_components import PEPACSClassifier
@@ -21,7 +22,8 @@ def expected_case(
         cl: PEPACSClassifier,
         p0: Perception,
         p1: Perception,
-        time: int
+        time: int,
+        transition: Optional[Transition] = None
     ) -> Optional[PEPACSClassifier]:
     """
     Controls the expected case of a classifier with the help of 
@@ -33,6 +35,7 @@ def expected_case(
         p0: Perception
         p1: Perception
         time: int
+        transition: Optional[Transition]
 
     Returns
     ----------
@@ -44,7 +47,7 @@ def expected_case(
     if aliasing_detection.is_state_aliased(cl.condition, cl.mark, p0):
         cl.ee = True
 
-    return alp_common.expected_case(cl, p0, time, p1)
+    return alp_common.expected_case(cl, p0, time, p1, transition)
 
 
 def apply_enhanced_effect_part_check(
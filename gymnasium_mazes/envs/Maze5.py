@@ -14,7 +14,7 @@ from ..envs import MazeGymEnv
 import numpy as np
 
 class Maze5(MazeGymEnv):
-    def __init__(self, slippery_prob=0., render_mode='aliasing_human'):
+    def __init__(self, slippery_prob=0., render_mode='aliasing_human', integer_observations=False):
         super().__init__(
             np.matrix([
             [1, 1, 1, 1, 1, 1, 1, 1, 1],
@@ -39,5 +39,6 @@ class Maze5(MazeGymEnv):
             [1, 1, 1, 1, 1, 1, 1, 1, 1],
             ]),
             slippery_prob=slippery_prob,
-            render_mode=render_mode
+            render_mode=render_mode,
+            integer_observations=integer_observations
         )
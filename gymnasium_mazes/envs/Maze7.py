@@ -15,7 +15,7 @@ from ..envs import MazeGymEnv
 import numpy as np
 
 class Maze7(MazeGymEnv):
-    def __init__(self, slippery_prob=0., render_mode='aliasing_human'):
+    def __init__(self, slippery_prob=0., render_mode='aliasing_human', integer_observations=False):
         super().__init__(
             np.matrix([
             [1, 1, 1, 1, 1],
@@ -36,5 +36,6 @@ class Maze7(MazeGymEnv):
             [1, 1, 1, 1, 1],
             ]),
             slippery_prob=slippery_prob,
-            render_mode=render_mode
+            render_mode=render_mode,
+            integer_observations=integer_observations
         )
@@ -15,7 +15,7 @@ from ..envs import MazeGymEnv
 import numpy as np
 
 class Sutton(MazeGymEnv):
-    def __init__(self, slippery_prob=0., render_mode='aliasing_human'):
+    def __init__(self, slippery_prob=0., render_mode='aliasing_human', integer_observations=False):
         super().__init__(
             np.matrix([
             [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
@@ -38,5 +38,6 @@ class Sutton(MazeGymEnv):
             [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
             ]),
             slippery_prob=slippery_prob,
-            render_mode=render_mode
+            render_mode=render_mode,
+            integer_observations=integer_observations
         )
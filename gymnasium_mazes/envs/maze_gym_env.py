@@ -87,8 +87,12 @@ class MazeObservationSpace(gym.Space):
 class MazeGymEnv(gym.Env):
     metadata = {'render_modes': ['human', 'ansi', 'aliasing_human'], "render_fps": 1}
 
-    def __init__(self, matrix, aliasing_matrix, slippery_prob=0., render_mode='aliasing_human'):
+    def __init__(self, matrix, aliasing_matrix, slippery_prob=0., render_mode='aliasing_human', integer_observations=False):
         self.maze = matrix
+        # Observed symbols are converted once, as int or str depending on integer_observations
+        to_symbol = int if integer_observations else str
+        self._symbols = [[to_symbol(el) for el in row] for row in np.asarray(matrix).tolist()]
+        self._wall_symbol = to_symbol(MazeObservationSpace.OBSERVATION_MAPPING['WALL'])
         self.aliased_maze_to_plot = aliasing_matrix
         self.max_x = self.maze.shape[1]
         self.max_y = self.maze.shape[0]
@@ -108,10 +112,10 @@ class MazeGymEnv(gym.Env):
         previous_observation = self._get_obs()
         if self.np_random.random() < self._slippery_prob:
             random_action = self.np_random.integers(len(Actions))
-            if previous_observation[random_action] != str(self.observation_space.get_mappping('WALL')):
+            if previous_observation[random_action] != self._wall_symbol:
                 self._agent_location += Actions(random_action).np_direction
         else:
-            if previous_observation[action] != str(self.observation_space.get_mappping('WALL')):
+            if previous_observation[action] != self._wall_symbol:
                 self._agent_location += Actions(action).np_direction
         observation = self._get_obs()
         reward = self._get_reward()
@@ -125,46 +129,47 @@ class MazeGymEnv(gym.Env):
             raise ValueError('X position not within allowed range')
         if not (0 <= pos_y < self.max_y):
             raise ValueError('Y position not within allowed range')
+        symbols = self._symbols
         # Position N
         if pos_y == 0:
             n = None
         else:
-            n = str(self.maze[pos_y - 1, pos_x])
+            n = symbols[pos_y - 1][pos_x]
         # Position NE
         if pos_x == self.max_x - 1 or pos_y == 0:
             ne = None
         else:
-            ne = str(self.maze[pos_y - 1, pos_x + 1])
+            ne = symbols[pos_y - 1][pos_x + 1]
         # Position E
         if pos_x == self.max_x - 1:
             e = None
         else:
-            e = str(self.maze[pos_y, pos_x + 1])
+            e = symbols[pos_y][pos_x + 1]
         # Position SE
         if pos_x == self.max_x - 1 or pos_y == self.max_y - 1:
             se = None
         else:
-            se = str(self.maze[pos_y + 1, pos_x + 1])
+            se = symbols[pos_y + 1][pos_x + 1]
         # Position S
         if pos_y == (self.max_y - 1):
             s = None
         else:
-            s = str(self.maze[pos_y + 1, pos_x])
+            s = symbols[pos_y + 1][pos_x]
         # Position SW
         if pos_x == 0 or pos_y == self.max_y - 1:
             sw = None
         else:
-            sw = str(self.maze[pos_y + 1, pos_x - 1])
+            sw = symbols[pos_y + 1][pos_x - 1]
         # Position W
         if pos_x == 0:
             w = None
         else:
-            w = str(self.maze[pos_y, pos_x - 1])
+            w = symbols[pos_y][pos_x - 1]
         # Position NW
         if pos_x == 0 or pos_y == 0:
             nw = None
         else:
-            nw = str(self.maze[pos_y - 1, pos_x - 1])
+            nw = symbols[pos_y - 1][pos_x - 1]
         return n, ne, e, se, s, sw, w, nw
 
     def _get_obs(self):
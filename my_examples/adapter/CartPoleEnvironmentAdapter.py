@@ -10,10 +10,13 @@ class CartPoleEnvironmentAdapter(EnvironmentAdapter):
 
     def __init__(
             self, 
-            buckets=(1, 1, 6, 3,)
+            buckets=(1, 1, 6, 3,),
+            integer_symbols=False
         ) -> None:
         super().__init__()
         self.buckets = buckets
+        # Keeps the bucket indexes as int symbols, to be used with a SymbolAlphabet
+        self.integer_symbols = integer_symbols
 
     def to_genotype(self, env, phenotype):
         """
@@ -26,6 +29,7 @@ class CartPoleEnvironmentAdapter(EnvironmentAdapter):
             ratios = [(obs[i] + abs(lower_bounds[i])) / (upper_bounds[i] - lower_bounds[i]) for i in range(len(obs))]
             new_obs = [int(round((self.buckets[i] - 1) * ratios[i])) for i in range(len(obs))]
             new_obs = [min(self.buckets[i] - 1, max(0, new_obs[i])) for i in range(len(obs))]
-            new_obs = [str(new_obs[i]) for i in range(len(obs))]
+            if not self.integer_symbols:
+                new_obs = [str(new_obs[i]) for i in range(len(obs))]
             return tuple(new_obs)
         return _discretize(env, phenotype)
\ No newline at end of file
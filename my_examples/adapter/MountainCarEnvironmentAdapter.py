@@ -8,9 +8,12 @@ class MountainCarEnvironmentAdapter(EnvironmentAdapter):
     def __init__(
             self, 
             pos_bucket = 5, 
-            vel_bucket = 4
+            vel_bucket = 4,
+            integer_symbols = False
         ) -> None:
         super().__init__()
+        # Keeps the bin indexes as int symbols, to be used with a SymbolAlphabet
+        self.integer_symbols = integer_symbols
         self.pos_space = np.linspace(-1.2, 0.6, num=pos_bucket, endpoint=False)
         self.vel_space = np.linspace(-0.07, 0.07, num=vel_bucket, endpoint=False)
 
@@ -25,6 +28,8 @@ class MountainCarEnvironmentAdapter(EnvironmentAdapter):
             if pos_bin == 0:
                 pos_bin = 1
             vel_bin = int(np.digitize(vel, self.vel_space, right = False))
+            if self.integer_symbols:
+                return (pos_bin, vel_bin)
             return (str(pos_bin), str(vel_bin))
             
         return _discretize(env, phenotype)
\ No newline at end of file
@@ -5,6 +5,8 @@
 """
 import statistics
 
+from agents.common import Transition
+
 
 def population_metrics(
         population,
@@ -44,8 +46,9 @@ def _maze_metrics(
         nr_correct = 0
         # For all possible destinations from each path cell
         for p0, action, p1 in set(env_trans):
+            transition = Transition(p0, p1)
             if any(True for cl in reliable_classifiers
-                    if cl.does_predict_successfully(p0, action, p1)):
+                    if cl.does_predict_successfully(p0, action, p1, transition)):
                 nr_correct += 1
         return nr_correct / len(set(env_trans)) * 100.0
 